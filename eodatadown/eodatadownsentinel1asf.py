@@ -36,15 +36,41 @@ EODataDown - a sensor class for Sentinel-1 data downloaded from Alaska Satellite
 import logging
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import sys
 import datetime
+import math
+import time
 import multiprocessing
 import shutil
 import importlib
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 
 import rsgislib
+from osgeo import ogr
+
+try:
+    from rsgislib.tools import visualisation as rsgis_vis
+except ImportError:
+    # The visualisation tools depend on optional libraries; only the quicklook,
+    # tilecache and visual overview functions need them.
+    rsgis_vis = None
+
+try:
+    # orjson is used to read/write the database JSON files if it is available.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # ijson is used to incrementally parse large database JSON files if it is available.
+    import ijson
+except ImportError:
+    ijson = None
 
 import eodatadown.eodatadownutils
 from eodatadown.eodatadownutils import EODataDownException
@@ -63,9 +89,81 @@ logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+# Database JSON files larger than this (bytes) are parsed incrementally (if ijson is available)
+# and the records inserted in batches of _IMPORT_BATCH_SIZE.
+_IMPORT_STREAM_MIN_SIZE = 10 * 1024 * 1024
+_IMPORT_BATCH_SIZE = 1000
+
+# With SQLAlchemy 2.0 executemany INSERTs are sent as multi-row VALUES statements
+# ('insertmanyvalues'); use larger pages than the default of 1000 rows.
+_INSERT_ENGINE_KWARGS = dict()
+if int(sqlalchemy.__version__.split('.')[0]) >= 2:
+    _INSERT_ENGINE_KWARGS['insertmanyvalues_page_size'] = 10000
+
+
+def _list_tree(path):
+    """
+    List the directories and files within a directory tree. A directory is always
+    listed after its parent directory.
+
+    :param path: the top directory of the tree.
+    :return: tuple (dir_paths, file_paths)
+    """
+    dir_paths = []
+    file_paths = []
+    dirs_to_scan = [path]
+    while dirs_to_scan:
+        dir_path = dirs_to_scan.pop()
+        dir_paths.append(dir_path)
+        with os.scandir(dir_path) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.is_dir(follow_symlinks=False):
+                    dirs_to_scan.append(dir_entry.path)
+                else:
+                    file_paths.append(dir_entry.path)
+    return dir_paths, file_paths
+
+
+def _fast_rmtree(paths, n_threads=8):
+    """
+    Delete a list of directory trees, removing the files of all the trees using a
+    single pool of threads (the file deletion is I/O bound so this is quicker than
+    shutil.rmtree for large trees, particularly on network file systems). The
+    directories are removed afterwards from the bottom up. On non-POSIX systems
+    (or if a path is a symlink) shutil.rmtree is used.
+
+    :param paths: list of the directories to be deleted.
+    :param n_threads: the number of threads used to delete the files.
+    """
+    tree_dir_paths = []
+    file_paths = []
+    for path in paths:
+        if (os.name != 'posix') or os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            dir_paths, tree_file_paths = _list_tree(path)
+            tree_dir_paths.append(dir_paths)
+            file_paths.extend(tree_file_paths)
+    if len(file_paths) > 0:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            list(executor.map(os.unlink, file_paths))
+    # A directory is always listed after its parent so reversing removes the children first.
+    for dir_paths in tree_dir_paths:
+        for dir_path in reversed(dir_paths):
+            os.rmdir(dir_path)
+
 
 class EDDSentinel1ASF(Base):
     __tablename__ = "EDDSentinel1ASF"
+    __table_args__ = (
+        # Supports the date range queries (filtered on Invalid/ARDProduct, ordered on Acquisition_Date).
+        sqlalchemy.Index("idx_s1asf_date_valid_ard", "Acquisition_Date", "Invalid", "ARDProduct"),
+        # Small block range index; scenes are appended in roughly acquisition date order.
+        sqlalchemy.Index("idx_s1asf_acq_date_brin", "Acquisition_Date", postgresql_using="brin",
+                         postgresql_with={"pages_per_range": 32}),
+        # Supports the scene status counts (get_sensor_summary_info).
+        sqlalchemy.Index("idx_s1asf_flags", "Invalid", "Downloaded", "ARDProduct", "DCLoaded", "Archived"),
+    )
 
     PID = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, autoincrement=True)
     Scene_ID = sqlalchemy.Column(sqlalchemy.String, nullable=False)
@@ -116,6 +214,29 @@ class EDDSentinel1ASF(Base):
     RegCheck = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False, default=False)
 
 
+# The scene footprint as a PostgreSQL box; indexed with GiST so bounding box overlap queries
+# (using the && operator) do not need to scan the whole table.
+_S1ASF_SCN_BOX = func.box(func.point(EDDSentinel1ASF.West_Lon, EDDSentinel1ASF.South_Lat),
+                          func.point(EDDSentinel1ASF.East_Lon, EDDSentinel1ASF.North_Lat))
+sqlalchemy.Index("idx_s1asf_bbox", _S1ASF_SCN_BOX, postgresql_using="gist")
+# Expression index for grouping/ordering the scenes on the acquisition date (find_unique_scn_dates).
+sqlalchemy.Index("idx_s1asf_acq_day", sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date))
+# Finding the last acquired scene (check_new_scns) reads the top of this index rather than sorting the table.
+sqlalchemy.Index("idx_s1asf_begin_pos_desc", EDDSentinel1ASF.BeginPosition.desc().nullslast())
+
+
+def _bbox_overlap_filter(bbox):
+    """
+    Create a filter which selects the scenes whose footprint box overlaps the bounding box.
+    The overlap test is inclusive of the boundaries so is used alongside the exact checks.
+
+    :param bbox: Bounding box [West_Lon, East_Lon, South_Lat, North_Lat]
+    :return: sqlalchemy filter expression.
+    """
+    qry_box = func.box(func.point(bbox[0], bbox[2]), func.point(bbox[1], bbox[3]))
+    return _S1ASF_SCN_BOX.op("&&")(qry_box)
+
+
 class EDDSentinel1ASFPlugins(Base):
     __tablename__ = "EDDSentinel1ASFPlugins"
     Scene_PID = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
@@ -129,22 +250,88 @@ class EDDSentinel1ASFPlugins(Base):
     ExtendedInfo = sqlalchemy.Column(sqlalchemy.dialects.postgresql.JSONB, nullable=True)
 
 
+# The (column name, is datetime) pairs for the scene and plugin tables used when exporting the records.
+_S1ASF_EXPORT_COLS = [(col.name, isinstance(col.type, sqlalchemy.DateTime))
+                      for col in EDDSentinel1ASF.__table__.columns]
+_S1ASF_PLGIN_EXPORT_COLS = [(col.name, isinstance(col.type, sqlalchemy.DateTime))
+                            for col in EDDSentinel1ASFPlugins.__table__.columns]
+
+
+# Loader option so only the columns used when processing a scene to ARD are read.
+_S1ASF_ARD_LOAD_COLS = sqlalchemy.orm.load_only(EDDSentinel1ASF.PID, EDDSentinel1ASF.Product_File_ID,
+                                                EDDSentinel1ASF.Polarization, EDDSentinel1ASF.Download_Path)
+
+# Statement built once and reused (with a bound scene PID) to find the plugin records for a scene.
+_SCN_PLUGINS_BY_PID = sqlalchemy.select(EDDSentinel1ASFPlugins).where(
+    EDDSentinel1ASFPlugins.Scene_PID == sqlalchemy.bindparam("scn_pid"))
+
+
+def _parse_asf_datetime(json_parse_helper, scn_json, key):
+    """
+    Parse a date/time value from an ASF scene JSON record. datetime.fromisoformat (implemented in C)
+    is tried first and if the string is not in a form it accepts then the
+    EDDJSONParseHelper.getDateTimeValue function is used with the ASF date/time formats.
+
+    :param json_parse_helper: an EDDJSONParseHelper instance.
+    :param scn_json: the JSON (dict) record for the scene.
+    :param key: the key for the date/time value.
+    :return: datetime object.
+    """
+    dt_str = json_parse_helper.getStrValue(scn_json, [key]).replace('Z', '')
+    try:
+        return datetime.datetime.fromisoformat(dt_str)
+    except ValueError:
+        return json_parse_helper.getDateTimeValue(scn_json, [key], ["%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S"])
+
+
+def _wkt_footprint_bounds(wkt_poly):
+    """
+    Get the bounds of a scene footprint WKT polygon. The envelope is calculated by OGR
+    (in C) and if OGR cannot parse the string then EDDGeoBBox.parseWKTPolygon is used.
+
+    :param wkt_poly: the footprint as a WKT POLYGON or MULTIPOLYGON string.
+    :return: tuple (north_lat, south_lat, east_lon, west_lon)
+    """
+    try:
+        footprint_geom = ogr.CreateGeometryFromWkt(wkt_poly)
+    except RuntimeError:
+        # Raised rather than returning None if OGR exceptions are enabled.
+        footprint_geom = None
+    if footprint_geom is not None:
+        west_lon, east_lon, south_lat, north_lat = footprint_geom.GetEnvelope()
+        return north_lat, south_lat, east_lon, west_lon
+    edd_footprint_bbox = eodatadown.eodatadownutils.EDDGeoBBox()
+    edd_footprint_bbox.parseWKTPolygon(wkt_poly)
+    return (edd_footprint_bbox.getNorthLat(), edd_footprint_bbox.getSouthLat(),
+            edd_footprint_bbox.getEastLon(), edd_footprint_bbox.getWestLon())
+
+
+# The helper classes hold no state so single instances are shared rather than created for each call.
+_JSON_PARSE_HELPER = eodatadown.eodatadownutils.EDDJSONParseHelper()
+_WGET_DOWNLOADER = eodatadown.eodatadownutils.EODDWGetDownload()
+
+
 def _download_scn_asf(params):
     """
-    Function which is used with multiprocessing pool object for downloading Sentinel-1 data from ASF.
-    :param params:
-    :return:
+    Function which is used with a thread pool for downloading Sentinel-1 data from ASF.
+    The database is not updated by this function; the caller updates the records for
+    all the downloaded scenes at once.
+    :param params: list of parameters [pid, product_file_id, remote_url, scn_lcl_dwnld_path, asf_user, asf_pass]
+    :return: dict of the database field values to be updated for the scene (including the PID)
+             or None if the download was not successful.
     """
     pid = params[0]
     product_file_id = params[1]
     remote_url = params[2]
-    db_info_obj = params[3]
-    scn_lcl_dwnld_path = params[4]
-    asf_user = params[5]
-    asf_pass = params[6]
+    scn_lcl_dwnld_path = params[3]
+    asf_user = params[4]
+    asf_pass = params[5]
     success = False
 
-    eodd_wget_downloader = eodatadown.eodatadownutils.EODDWGetDownload()
+    # Create the scene download directory (in the worker so it is not done serially before the downloads start).
+    os.makedirs(os.path.dirname(scn_lcl_dwnld_path), exist_ok=True)
+
+    eodd_wget_downloader = _WGET_DOWNLOADER
     start_date = datetime.datetime.now()
     try:
         success = eodd_wget_downloader.downloadFile(remote_url, scn_lcl_dwnld_path, username=asf_user,
@@ -154,23 +341,145 @@ def _download_scn_asf(params):
     end_date = datetime.datetime.now()
 
     if success and os.path.exists(scn_lcl_dwnld_path):
-        logger.debug("Set up database connection and update record.")
-        db_engine = sqlalchemy.create_engine(db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == pid).one_or_none()
-        if query_result is None:
-            logger.error("Could not find the scene within local database: " + product_file_id)
-        else:
-            query_result.Downloaded = True
-            query_result.Download_Start_Date = start_date
-            query_result.Download_End_Date = end_date
-            query_result.Download_Path = scn_lcl_dwnld_path
-            ses.commit()
-        ses.close()
-        logger.info("Finished download and updated database: {}".format(scn_lcl_dwnld_path))
-    else:
-        logger.error("Download did not complete, re-run and it should try again: {}".format(scn_lcl_dwnld_path))
+        logger.info("Finished download of {}: {}".format(product_file_id, scn_lcl_dwnld_path))
+        return dict(PID=pid, Downloaded=True, Download_Start_Date=start_date, Download_End_Date=end_date,
+                    Download_Path=scn_lcl_dwnld_path)
+    logger.error("Download did not complete, re-run and it should try again: {}".format(scn_lcl_dwnld_path))
+    return None
+
+
+def _create_scn_date_qklk(params):
+    """
+    Function which is used with multiprocessing pool object for creating the quicklook image for
+    the scenes acquired on a single date.
+    :param params: list of parameters [scn_files, bands, tmp_dir, vec_file, vec_lyr, quicklook_img,
+                   img_size, img_format, stretch_file]
+    """
+    scn_files = params[0]
+    bands = params[1]
+    tmp_dir = params[2]
+    vec_file = params[3]
+    vec_lyr = params[4]
+    quicklook_img = params[5]
+    img_size = params[6]
+    img_format = params[7]
+    stretch_file = params[8]
+
+    os.makedirs(tmp_dir, exist_ok=True)
+    try:
+        rsgis_vis.createQuicklookOverviewImgsVecOverlay(scn_files, bands, tmp_dir,
+                                                        vec_file, vec_lyr,
+                                                        outputImgs=quicklook_img,
+                                                        output_img_sizes=img_size,
+                                                        gdalformat=img_format,
+                                                        scale_axis='auto',
+                                                        stretch_file=stretch_file,
+                                                        overlay_clr=[255, 255, 255])
+    finally:
+        # The per-date temp directory is removed even if the quicklook could not be created.
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _calc_summary_stats(vals, key_prefix, key_suffix=''):
+    """
+    Calculate the summary statistics (mean, min, max, stdev, median and quartiles) for a list
+    of values. A single pass is used for the mean, variance (Welford's method), min and max
+    while the median and quartiles (equivalent to statistics.quantiles with the default
+    exclusive method) are read from one sorted copy of the values.
+
+    :param vals: list of numeric values (must not be empty).
+    :param key_prefix: prefix for the keys of the output dict (e.g., 'download_time_')
+    :param key_suffix: suffix for the keys of the output dict (e.g., '_secs')
+    :return: dict of statistics. The stdev and quartiles are only provided with more than one value.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    min_val = vals[0]
+    max_val = vals[0]
+    for val in vals:
+        n += 1
+        delta = val - mean
+        mean += delta / n
+        m2 += delta * (val - mean)
+        if val < min_val:
+            min_val = val
+        if val > max_val:
+            max_val = val
+    srt_vals = sorted(vals)
+    median, quartiles = _calc_median_quartiles(n, lambda pos: srt_vals[pos - 1])
+
+    stats_dict = dict()
+    stats_dict['{}mean{}'.format(key_prefix, key_suffix)] = mean
+    stats_dict['{}min{}'.format(key_prefix, key_suffix)] = min_val
+    stats_dict['{}max{}'.format(key_prefix, key_suffix)] = max_val
+    if n > 1:
+        stats_dict['{}stdev{}'.format(key_prefix, key_suffix)] = (m2 / (n - 1)) ** 0.5
+    stats_dict['{}median{}'.format(key_prefix, key_suffix)] = median
+    if quartiles is not None:
+        stats_dict['{}quartiles{}'.format(key_prefix, key_suffix)] = quartiles
+    return stats_dict
+
+
+def _median_quartile_positions(n):
+    """
+    Get the positions (1-based, within the sorted values) of the values needed to calculate
+    the median and quartiles using _calc_median_quartiles.
+
+    :param n: the number of values.
+    :return: set of positions.
+    """
+    mid = n // 2
+    positions = {mid + 1} if n % 2 else {mid, mid + 1}
+    if n > 1:
+        m = n + 1
+        for i in range(1, 4):
+            j = min(max(i * m // 4, 1), n - 1)
+            positions.update((j, j + 1))
+    return positions
+
+
+def _calc_median_quartiles(n, get_val):
+    """
+    Calculate the median and quartiles (equivalent to statistics.median and statistics.quantiles
+    with the default exclusive method) from the sorted values. Only the values at the positions
+    given by _median_quartile_positions are read.
+
+    :param n: the number of values (must be greater than zero).
+    :param get_val: function which returns the value at a (1-based) position within the sorted values.
+    :return: tuple (median, quartiles); quartiles is None if there is only one value.
+    """
+    mid = n // 2
+    median = get_val(mid + 1) if n % 2 else (get_val(mid) + get_val(mid + 1)) / 2
+    quartiles = None
+    if n > 1:
+        quartiles = []
+        m = n + 1
+        for i in range(1, 4):
+            j = min(max(i * m // 4, 1), n - 1)
+            delta = i * m - j * 4
+            quartiles.append((get_val(j) * (4 - delta) + get_val(j + 1) * delta) / 4)
+    return median, quartiles
+
+
+def _query_median_quartiles(ses, val_expr, n, *criteria):
+    """
+    Calculate the median and quartiles (using the same method as _calc_summary_stats) for a
+    column/expression within the database. Rather than reading all the values only those at the
+    positions needed are retrieved, using a single query numbering the sorted rows.
+
+    :param ses: the database session.
+    :param val_expr: the column or expression for the values.
+    :param n: the number of (non-NULL) values matching the criteria (must be greater than zero).
+    :param criteria: the filter criteria for the rows.
+    :return: tuple (median, quartiles) as floats; quartiles is None if there is only one value.
+    """
+    sorted_vals = sqlalchemy.select(val_expr.label('val'),
+                                    func.row_number().over(order_by=val_expr).label('pos')).where(
+            val_expr.isnot(None), *criteria).subquery()
+    pos_vals = {row.pos: float(row.val) for row in ses.execute(sqlalchemy.select(
+            sorted_vals.c.pos, sorted_vals.c.val).where(sorted_vals.c.pos.in_(_median_quartile_positions(n))))}
+    return _calc_median_quartiles(n, pos_vals.__getitem__)
 
 
 class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor):
@@ -198,6 +507,96 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         self.mask_vec_lyr = ''
         self.std_vis_img_stch = None
 
+        self._db_engine = None
+        self._db_engine_pid = None
+        self._session_factory = None
+        self._http_session = None
+
+        # Caches of the unique platforms and unique acquisition dates; cleared when the scenes are modified
+        # by this object and the entries expire after _query_cache_ttl seconds (so changes made by other
+        # processes are found). The number of date ranges cached is limited to _scn_dates_cache_max.
+        self._platforms_cache = None
+        self._scn_dates_cache = dict()
+        self._query_cache_ttl = 60
+        self._scn_dates_cache_max = 128
+        # Cache of the ARD image file found within each ARD product directory.
+        self._ard_file_cache = dict()
+
+    def _clear_query_caches(self):
+        """
+        A function which clears the cached unique platforms and acquisition dates. Called
+        when scenes are added, removed or their status is updated.
+        """
+        self._platforms_cache = None
+        self._scn_dates_cache = dict()
+
+    def _get_http_session(self):
+        """
+        A function which returns the HTTP session used to query ASF. The session is created on
+        the first call and reused so the connections (and TLS handshakes) are kept alive between
+        queries. Requests which fail with a transient server error are retried with a backoff.
+
+        :return: requests.Session object.
+        """
+        if self._http_session is None:
+            logger.debug("Creating HTTP Session Object.")
+            retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                            allowed_methods=["GET", "POST"])
+            http_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+            session_req = requests.Session()
+            session_req.mount("https://", http_adapter)
+            session_req.mount("http://", http_adapter)
+            session_req.auth = (self.asfUser, self.asfPass)
+            session_req.headers["User-Agent"] = "eoedatadown/" + str(eodatadown.EODATADOWN_VERSION)
+            self._http_session = session_req
+        return self._http_session
+
+    def _get_db_engine(self):
+        """
+        A function which returns the database engine. The engine (and therefore its connection
+        pool) is created on the first call and reused for subsequent calls. If the process has
+        been forked since the engine was created then a new engine is created, as pooled
+        connections cannot be shared between processes.
+
+        :return: sqlalchemy engine object.
+        """
+        if (self._db_engine is not None) and (self._db_engine_pid != os.getpid()):
+            logger.debug("Process has been forked, discarding the parent's Database Engine.")
+            # Do not close the connections as they are still in use by the parent process.
+            self._db_engine.dispose(close=False)
+            self._db_engine = None
+        if self._db_engine is None:
+            logger.debug("Creating Database Engine.")
+            self._db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn, pool_size=10, max_overflow=20,
+                                                       pool_pre_ping=True, pool_recycle=1800, pool_use_lifo=True,
+                                                       query_cache_size=1200, **_INSERT_ENGINE_KWARGS)
+            self._db_engine_pid = os.getpid()
+            self._session_factory = sqlalchemy.orm.sessionmaker(bind=self._db_engine)
+        return self._db_engine
+
+    def _get_session(self):
+        """
+        A function which returns a new database session using the shared database engine.
+
+        :return: sqlalchemy session object.
+        """
+        self._get_db_engine()
+        logger.debug("Creating Database Session.")
+        return self._session_factory()
+
+    @contextmanager
+    def _session(self):
+        """
+        A context manager which provides a database session which is always closed
+        when the block exits, including when an exception is raised.
+        """
+        ses = self._get_session()
+        try:
+            yield ses
+        finally:
+            ses.close()
+            logger.debug("Closed the database session.")
+
     def parse_sensor_config(self, config_file, first_parse=False):
         """
         Parse the JSON configuration file. If first_parse=True then a signature file will be created
@@ -352,16 +751,19 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         Be careful as running this function drops the table if it already exists and therefore
         any data would be lost.
         """
-        logger.debug("Creating Database Engine.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
+        db_engine = self._get_db_engine()
 
         if drop_tables:
             logger.debug("Drop system table if within the existing database.")
             Base.metadata.drop_all(db_engine)
 
         logger.debug("Creating Sentinel1ASF Database.")
-        Base.metadata.bind = db_engine
-        Base.metadata.create_all()
+        Base.metadata.create_all(db_engine)
+        # create_all does not add indexes to a table which already exists, so any of the scene table
+        # indexes missing from a database created with an earlier version are created here.
+        for tbl_idx in EDDSentinel1ASF.__table__.indexes:
+            tbl_idx.create(bind=db_engine, checkfirst=True)
+        self._clear_query_caches()
 
     def check_http_response(self, response, url):
         """
@@ -394,22 +796,19 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         Check whether there is new data available which is not within the existing database.
         Scenes not within the database will be added.
         """
-        logger.debug("Creating HTTP Session Object.")
-        session_req = requests.Session()
-        session_req.auth = (self.asfUser, self.asfPass)
-        user_agent = "eoedatadown/" + str(eodatadown.EODATADOWN_VERSION)
-        session_req.headers["User-Agent"] = user_agent
+        session_req = self._get_http_session()
 
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
 
         logger.debug(
             "Find the start date for query - if table is empty then using config date otherwise date of last acquried image.")
         query_date = self.startDate
-        if (not check_from_start) and (ses.query(EDDSentinel1ASF).first() is not None):
-            query_date = ses.query(EDDSentinel1ASF).order_by(EDDSentinel1ASF.BeginPosition.desc()).first().BeginPosition
+        if not check_from_start:
+            # Only the date column is read; None if the table is empty.
+            last_begin_pos = ses.query(EDDSentinel1ASF.BeginPosition).order_by(
+                    EDDSentinel1ASF.BeginPosition.desc().nullslast()).limit(1).scalar()
+            if last_begin_pos is not None:
+                query_date = last_begin_pos
         logger.info("Query with start at date: " + str(query_date))
 
         # Get the next PID value to ensure increment
@@ -418,35 +817,46 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
             n_max_pid = 0
         else:
             n_max_pid = c_max_pid + 1
+        first_new_pid = n_max_pid
 
         str_start_datetime = query_date.isoformat()+"UTC"
         str_now_datetime = datetime.datetime.utcnow().isoformat()+"UTC"
-        query_str_date = "start="+str_start_datetime+"\&end="+str_now_datetime
-        query_str_product = "processingLevel=GRD_HD"
-        query_str_platform = "platform=SA,SB"
+        # The part of the query which is the same for all the geographic bounds.
+        const_query_str = f"platform=SA,SB&processingLevel=GRD_HD&start={str_start_datetime}&end={str_now_datetime}"
         query_datetime = datetime.datetime.now()
-        json_parse_helper = eodatadown.eodatadownutils.EDDJSONParseHelper()
+        json_parse_helper = _JSON_PARSE_HELPER
         eoed_utils = eodatadown.eodatadownutils.EODataDownUtils()
 
-        new_scns_avail = False
+        # Scenes already in the database are skipped by the database on insert (Product_File_ID
+        # is unique), this set just avoids duplicates between the responses for the bounds.
+        product_file_ids = set()
         db_records = list()
+        query_urls = list()
         for geo_bound in self.geoBounds:
             csv_poly = geo_bound.getCSVPolygon()
             logger.info("Checking for available scenes for \"" + csv_poly + "\"")
-            query_str_geobound = "polygon="+ csv_poly
-            query_str = query_str_geobound + "&" + query_str_platform + "&" + query_str_product + "&" + query_str_date + "&output=json"
-            query_url = self.base_api_url + "?" + query_str
+            query_url = f"{self.base_api_url}?polygon={csv_poly}&{const_query_str}&output=json"
             logger.debug("Going to use the following URL: " + query_url)
-            response = session_req.get(query_url, auth=session_req.auth)
+            query_urls.append(query_url)
+
+        # The queries are network bound so are run concurrently (a few at a time so the ASF
+        # service isn't overloaded); the responses are parsed in order within this thread
+        # as the database session cannot be shared between threads.
+        responses = list()
+        if len(query_urls) > 0:
+            with ThreadPoolExecutor(max_workers=min(len(query_urls), 4)) as executor:
+                responses = list(executor.map(session_req.get, query_urls))
+
+        for query_url, response in zip(query_urls, responses):
             if self.check_http_response(response, query_url):
-                rsp_json = response.json()[0]
-                product_file_ids = dict()
+                if orjson is not None:
+                    rsp_json = orjson.loads(response.content)[0]
+                else:
+                    rsp_json = response.json()[0]
                 for scn_json in rsp_json:
                     product_file_id_val = json_parse_helper.getStrValue(scn_json, ["product_file_id"])
-                    query_rtn = ses.query(EDDSentinel1ASF).filter(
-                            EDDSentinel1ASF.Product_File_ID == product_file_id_val).all()
-                    if (len(query_rtn) == 0) and (not(product_file_id_val in product_file_ids)):
-                        product_file_ids[product_file_id_val] = True
+                    if product_file_id_val not in product_file_ids:
+                        product_file_ids.add(product_file_id_val)
                         scene_id_val = json_parse_helper.getStrValue(scn_json, ["sceneId"])
                         product_name_val = json_parse_helper.getStrValue(scn_json, ["productName"])
                         absolute_orbit_val = int(json_parse_helper.getNumericValue(scn_json, ["absoluteOrbit"]))
@@ -465,18 +875,18 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
                         look_direction_val = json_parse_helper.getStrValue(scn_json, ["lookDirection"])
                         platform_val = json_parse_helper.getStrValue(scn_json, ["platform"])
                         polarization_val = json_parse_helper.getStrValue(scn_json, ["polarization"])
-                        processing_date_val = json_parse_helper.getDateTimeValue(scn_json, ["processingDate"], ["%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S"])
+                        processing_date_val = _parse_asf_datetime(json_parse_helper, scn_json, "processingDate")
                         processing_description_val = json_parse_helper.getStrValue(scn_json, ["processingDescription"])
                         processing_level_val = json_parse_helper.getStrValue(scn_json, ["processingLevel"])
                         processing_type_val = json_parse_helper.getStrValue(scn_json, ["processingType"])
                         processing_type_disp_val = json_parse_helper.getStrValue(scn_json, ["processingTypeDisplay"])
-                        scene_date_val = json_parse_helper.getDateTimeValue(scn_json, ["sceneDate"], ["%Y-%m-%dT%H:%M:%S.%f","%Y-%m-%dT%H:%M:%S"])
+                        scene_date_val = _parse_asf_datetime(json_parse_helper, scn_json, "sceneDate")
                         sensor_val = json_parse_helper.getStrValue(scn_json, ["sensor"])
-                        start_time_val = json_parse_helper.getDateTimeValue(scn_json, ["startTime"], ["%Y-%m-%dT%H:%M:%S.%f","%Y-%m-%dT%H:%M:%S"])
-                        stop_time_val = json_parse_helper.getDateTimeValue(scn_json, ["stopTime"], ["%Y-%m-%dT%H:%M:%S.%f","%Y-%m-%dT%H:%M:%S"])
+                        start_time_val = _parse_asf_datetime(json_parse_helper, scn_json, "startTime")
+                        stop_time_val = _parse_asf_datetime(json_parse_helper, scn_json, "stopTime")
                         footprint_wkt_val = json_parse_helper.getStrValue(scn_json, ["stringFootprint"])
-                        edd_footprint_bbox = eodatadown.eodatadownutils.EDDGeoBBox()
-                        edd_footprint_bbox.parseWKTPolygon(footprint_wkt_val)
+                        north_lat_val, south_lat_val, east_lon_val, west_lon_val = _wkt_footprint_bounds(
+                                footprint_wkt_val)
                         download_url_val = json_parse_helper.getStrValue(scn_json, ["downloadUrl"])
                         file_name_val = json_parse_helper.getStrValue(scn_json, ["fileName"])
                         download_file_size_mb_strval = json_parse_helper.getStrValue(scn_json, ["sizeMB"])
@@ -487,33 +897,45 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
                             download_file_size_mb_val = None
 
 
-                        db_records.append(EDDSentinel1ASF(PID=n_max_pid, Scene_ID=scene_id_val,
-                                                          Product_Name=product_name_val, Product_File_ID=product_file_id_val,
-                                                          ABS_Orbit=absolute_orbit_val, Rel_Orbit=relative_orbit_val,
-                                                          Doppler=doppler_val, Flight_Direction=flight_direction_val,
-                                                          Granule_Name=granule_name_val, Granule_Type=granule_type_val,
-                                                          Incidence_Angle=incidence_angle_val, Look_Direction=look_direction_val,
-                                                          Platform=platform_val, Polarization=polarization_val,
-                                                          Process_Date=processing_date_val, Process_Description=processing_description_val,
-                                                          Process_Level=processing_level_val, Process_Type=processing_type_val,
-                                                          Process_Type_Disp=processing_type_disp_val, Acquisition_Date=scene_date_val,
-                                                          Sensor=sensor_val, BeginPosition=start_time_val, EndPosition=stop_time_val,
-                                                          North_Lat=edd_footprint_bbox.getNorthLat(), South_Lat=edd_footprint_bbox.getSouthLat(),
-                                                          East_Lon=edd_footprint_bbox.getEastLon(), West_Lon=edd_footprint_bbox.getWestLon(),
-                                                          Remote_URL=download_url_val, Remote_FileName=file_name_val,
-                                                          Total_Size=download_file_size_mb_val, Query_Date=query_datetime))
+                        db_records.append(dict(PID=n_max_pid, Scene_ID=scene_id_val,
+                                               Product_Name=product_name_val, Product_File_ID=product_file_id_val,
+                                               ABS_Orbit=absolute_orbit_val, Rel_Orbit=relative_orbit_val,
+                                               Doppler=doppler_val, Flight_Direction=flight_direction_val,
+                                               Granule_Name=granule_name_val, Granule_Type=granule_type_val,
+                                               Incidence_Angle=incidence_angle_val, Look_Direction=look_direction_val,
+                                               Platform=platform_val, Polarization=polarization_val,
+                                               Process_Date=processing_date_val, Process_Description=processing_description_val,
+                                               Process_Level=processing_level_val, Process_Type=processing_type_val,
+                                               Process_Type_Disp=processing_type_disp_val, Acquisition_Date=scene_date_val,
+                                               Sensor=sensor_val, BeginPosition=start_time_val, EndPosition=stop_time_val,
+                                               North_Lat=north_lat_val, South_Lat=south_lat_val,
+                                               East_Lon=east_lon_val, West_Lon=west_lon_val,
+                                               Remote_URL=download_url_val, Remote_FileName=file_name_val,
+                                               Total_Size=download_file_size_mb_val, Query_Date=query_datetime))
                         n_max_pid = n_max_pid + 1
 
                 if len(db_records) > 0:
                     logger.debug("Writing records to the database.")
-                    ses.add_all(db_records)
-                    ses.commit()
-                    logger.debug("Written and committed records to the database.")
-                    new_scns_avail = True
-
+                    # Insert the records (dicts of column values) as a single executemany INSERT
+                    # rather than as ORM objects. Scenes which are already in the database are
+                    # ignored using the unique constraint on Product_File_ID.
+                    insert_stmt = sqlalchemy.dialects.postgresql.insert(EDDSentinel1ASF).on_conflict_do_nothing(
+                            index_elements=[EDDSentinel1ASF.Product_File_ID])
+                    ses.execute(insert_stmt, db_records)
+                    logger.debug("Written records to the database.")
+                    # The records have been written so don't re-insert them with the next query's records.
+                    db_records = list()
+
+        # Any of the PIDs allocated within this check only exist if the scene was inserted.
+        c_max_pid = ses.query(func.max(EDDSentinel1ASF.PID)).scalar()
+        new_scns_avail = (c_max_pid is not None) and (c_max_pid >= first_new_pid)
+        # All the new records are committed as a single transaction.
         ses.commit()
+        logger.debug("Committed records to the database.")
         ses.close()
         logger.debug("Closed Database session")
+        if new_scns_avail:
+            self._clear_query_caches()
         edd_usage_db = EODataDownUpdateUsageLogDB(self.db_info_obj)
         edd_usage_db.add_entry(description_val="Checked for availability of new scenes", sensor_val=self.sensor_name,
                                updated_lcl_db=True, scns_avail=new_scns_avail)
@@ -530,10 +952,7 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         """
         if self.scn_intersect:
             import rsgislib.vectorutils
-            logger.debug("Creating Database Engine and Session.")
-            db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-            session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-            ses = session_sqlalc()
+            ses = self._get_session()
             logger.debug("Perform query to find scenes which need downloading.")
 
             if all_scns:
@@ -542,7 +961,7 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
                 scns = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Downloaded == False).order_by(
                         EDDSentinel1ASF.Acquisition_Date.asc()).all()
 
-            if scns is not None:
+            if scns:
                 eodd_vec_utils = eodatadown.eodatadownutils.EODDVectorUtils()
                 vec_idx, geom_lst = eodd_vec_utils.create_rtree_index(self.scn_intersect_vec_file,
                                                                       self.scn_intersect_vec_lyr)
@@ -568,6 +987,7 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
                         ses.query(EDDSentinel1ASF.PID).filter(EDDSentinel1ASF.PID == scn.PID).delete()
                         ses.commit()
             ses.close()
+            self._clear_query_caches()
 
     def get_scnlist_all(self):
         """
@@ -575,16 +995,10 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
 
         :return: list of integers
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
         logger.debug("Perform query to find scenes which need downloading.")
-        query_result = ses.query(EDDSentinel1ASF).order_by(EDDSentinel1ASF.Acquisition_Date.asc()).all()
-        scns = list()
-        if query_result is not None:
-            for record in query_result:
-                scns.append(record.PID)
+        query_result = ses.query(EDDSentinel1ASF.PID).order_by(EDDSentinel1ASF.Acquisition_Date.asc()).yield_per(1000)
+        scns = [record.PID for record in query_result]
         ses.close()
         logger.debug("Closed the database session.")
         return scns
@@ -595,19 +1009,13 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         database but have yet to be downloaded.
         :return: A list of unq_ids for the scenes. The list will be empty if there are no scenes to download.
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
 
         logger.debug("Perform query to find scenes which need downloading.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Downloaded == False).filter(
-            EDDSentinel1ASF.Remote_URL is not None).order_by(EDDSentinel1ASF.Acquisition_Date.asc()).all()
+        query_result = ses.query(EDDSentinel1ASF.PID).filter(EDDSentinel1ASF.Downloaded == False).filter(
+            EDDSentinel1ASF.Remote_URL.isnot(None)).order_by(EDDSentinel1ASF.Acquisition_Date.asc()).yield_per(1000)
 
-        scns2dwnld = list()
-        if query_result is not None:
-            for record in query_result:
-                scns2dwnld.append(record.PID)
+        scns2dwnld = [record.PID for record in query_result]
         ses.close()
         logger.debug("Closed the database session.")
         return scns2dwnld
@@ -618,16 +1026,31 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param unq_id: the unique ID of the scene to be downloaded.
         :return: boolean (True for downloaded; False for not downloaded)
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
         logger.debug("Perform query to find scenes which need downloading.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one()
+        query_result = ses.query(EDDSentinel1ASF.Downloaded).filter(EDDSentinel1ASF.PID == unq_id).one()
         ses.close()
         logger.debug("Closed the database session.")
         return query_result.Downloaded
 
+    def has_scns_download(self, unq_ids):
+        """
+        A function which checks whether a list of scenes have been downloaded, using a single
+        query rather than calling has_scn_download for each scene.
+        :param unq_ids: list of the unique IDs of the scenes.
+        :return: dict with the unique ID as the key and boolean value (True for downloaded; False for
+                 not downloaded). Unique IDs which are not within the database are not in the dict.
+        """
+        scns_dwnld = dict()
+        with self._session() as ses:
+            logger.debug("Perform query to find whether the scenes have been downloaded.")
+            unq_ids = list(unq_ids)
+            for i in range(0, len(unq_ids), 1000):
+                query_rtn = ses.query(EDDSentinel1ASF.PID, EDDSentinel1ASF.Downloaded).filter(
+                        EDDSentinel1ASF.PID.in_(unq_ids[i:i + 1000])).all()
+                scns_dwnld.update((scn_rtn.PID, scn_rtn.Downloaded) for scn_rtn in query_rtn)
+        return scns_dwnld
+
     def download_scn(self, unq_id):
         """
         A function which downloads an individual scene and updates the database if download is successful.
@@ -637,79 +1060,91 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         if not os.path.exists(self.baseDownloadPath):
             raise EODataDownException("The download path does not exist, please create and run again.")
 
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
 
-        logger.debug("Perform query to find scenes which need downloading.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id,
-                                                         EDDSentinel1ASF.Downloaded == False).filter(
-                                                         EDDSentinel1ASF.Remote_URL is not None).all()
+        logger.debug("Perform query to find scene to be downloaded.")
+        # PID is the primary key so the scene is retrieved with Session.get.
+        record = ses.get(EDDSentinel1ASF, unq_id)
         ses.close()
         success = False
-        if query_result is not None:
-            if len(query_result) == 1:
-                record = query_result[0]
-                logger.debug("Building download info for '" + record.Remote_URL + "'")
-                scn_lcl_dwnld_path = os.path.join(self.baseDownloadPath,
-                                                  "{}_{}".format(record.Product_File_ID, record.PID))
-                if not os.path.exists(scn_lcl_dwnld_path):
-                    os.mkdir(scn_lcl_dwnld_path)
-                out_filename = record.Remote_FileName
-                _download_scn_asf([record.PID, record.Product_File_ID, record.Remote_URL, self.db_info_obj,
-                                     os.path.join(scn_lcl_dwnld_path, out_filename), self.asfUser, self.asfPass])
-                success = True
-            elif len(query_result) == 0:
-                logger.info("PID {0} is either not available or already been downloaded.".format(unq_id))
-            else:
-                logger.error("PID {0} has returned more than 1 scene - must be unique something really wrong.".
-                             format(unq_id))
-                raise EODataDownException("There was more than 1 scene which has been found - "
-                                          "something has gone really wrong!")
+        if (record is not None) and (not record.Downloaded) and (record.Remote_URL is not None):
+            logger.debug("Building download info for '" + record.Remote_URL + "'")
+            scn_lcl_dwnld_path = os.path.join(self.baseDownloadPath,
+                                              "{}_{}".format(record.Product_File_ID, record.PID))
+            out_filename = record.Remote_FileName
+            dwnld_result = _download_scn_asf([record.PID, record.Product_File_ID, record.Remote_URL,
+                                              os.path.join(scn_lcl_dwnld_path, out_filename),
+                                              self.asfUser, self.asfPass])
+            if dwnld_result is not None:
+                with self._session() as ses:
+                    ses.bulk_update_mappings(EDDSentinel1ASF, [dwnld_result])
+                    ses.commit()
+                logger.debug("Updated the database for the downloaded scene.")
+            success = True
         else:
-            logger.error("PID {0} has not returned a scene - check inputs.".format(unq_id))
-            raise EODataDownException("PID {0} has not returned a scene - check inputs.".format(unq_id))
+            logger.info("PID {0} is either not available or already been downloaded.".format(unq_id))
         return success
 
     def download_all_avail(self, n_cores):
         """
         Queries the database to find all scenes which have not been downloaded and then downloads them.
-        This function uses the python multiprocessing Pool to allow multiple simultaneous downloads to occur.
+        This function uses a pool of threads to allow multiple simultaneous downloads to occur.
         Be careful not use more cores than your internet connection and server can handle.
         :param n_cores: The number of scenes to be simultaneously downloaded.
         """
         if not os.path.exists(self.baseDownloadPath):
             raise EODataDownException("The download path does not exist, please create and run again.")
 
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
 
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Downloaded == False).filter(
-                                                         EDDSentinel1ASF.Remote_URL is not None).all()
-        dwnld_params = list()
-        downloaded_new_scns = False
-        if query_result is not None:
+        # Only the columns needed for the download are read and the rows are streamed from the database.
+        query_result = ses.query(EDDSentinel1ASF.PID, EDDSentinel1ASF.Product_File_ID, EDDSentinel1ASF.Remote_URL,
+                                 EDDSentinel1ASF.Remote_FileName).filter(
+                                 EDDSentinel1ASF.Downloaded == False,
+                                 EDDSentinel1ASF.Remote_URL.isnot(None)).yield_per(500)
+
+        logger.info("Start downloading the scenes.")
+        # The downloads are undertaken by wget subprocesses so threads are used to run them
+        # rather than a pool of processes. Each download is submitted as its parameters are
+        # built so the first downloads start straight away.
+        dwnld_results = list()
+        dwnld_error = None
+        with ThreadPoolExecutor(max_workers=n_cores) as executor:
+            dwnld_futures = list()
             for record in query_result:
                 scn_lcl_dwnld_path = os.path.join(self.baseDownloadPath, "{}_{}".format(record.Product_File_ID, record.PID))
-                if not os.path.exists(scn_lcl_dwnld_path):
-                    os.mkdir(scn_lcl_dwnld_path)
-                out_filename = record.Remote_FileName
-                downloaded_new_scns = True
-                dwnld_params.append([record.PID, record.Product_File_ID, record.Remote_URL, self.db_info_obj,
-                                     os.path.join(scn_lcl_dwnld_path, out_filename), self.asfUser, self.asfPass])
-        else:
-            downloaded_new_scns = False
-            logger.info("There are no scenes to be downloaded.")
+                dwnld_futures.append(executor.submit(_download_scn_asf, [record.PID, record.Product_File_ID,
+                                                                         record.Remote_URL,
+                                                                         os.path.join(scn_lcl_dwnld_path,
+                                                                                      record.Remote_FileName),
+                                                                         self.asfUser, self.asfPass]))
+            ses.close()
+            logger.debug("Closed the database session.")
 
-        ses.close()
-        logger.debug("Closed the database session.")
+            downloaded_new_scns = len(dwnld_futures) > 0
+            if not downloaded_new_scns:
+                logger.info("There are no scenes to be downloaded.")
 
-        logger.info("Start downloading the scenes.")
-        with multiprocessing.Pool(processes=n_cores) as pool:
-            pool.map(_download_scn_asf, dwnld_params)
+            for dwnld_future in as_completed(dwnld_futures):
+                try:
+                    dwnld_result = dwnld_future.result()
+                except Exception as e:
+                    # Keep the first error to raise once the completed downloads have been recorded.
+                    logger.error("An error has occurred while downloading from ASF: '{}'".format(e))
+                    if dwnld_error is None:
+                        dwnld_error = e
+                    continue
+                if dwnld_result is not None:
+                    dwnld_results.append(dwnld_result)
+
+        if len(dwnld_results) > 0:
+            logger.debug("Update the database for the {} downloaded scenes.".format(len(dwnld_results)))
+            # A single bulk UPDATE (by PID) and commit for all the downloaded scenes.
+            with self._session() as ses:
+                ses.bulk_update_mappings(EDDSentinel1ASF, dwnld_results)
+                ses.commit()
+        if dwnld_error is not None:
+            raise dwnld_error
         logger.info("Finished downloading the scenes.")
         edd_usage_db = EODataDownUpdateUsageLogDB(self.db_info_obj)
         edd_usage_db.add_entry(description_val="Checked downloaded new scenes.", sensor_val=self.sensor_name,
@@ -721,21 +1156,15 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         processed to an analysis ready data (ARD) format.
         :return: A list of unq_ids for the scenes. The list will be empty if there are no scenes to process.
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
 
         logger.debug("Perform query to find scenes which need downloading.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Downloaded == True,
-                                                         EDDSentinel1ASF.ARDProduct == False,
-                                                         EDDSentinel1ASF.Invalid == False).order_by(
-                                                         EDDSentinel1ASF.Acquisition_Date.asc()).all()
+        query_result = ses.query(EDDSentinel1ASF.PID).filter(EDDSentinel1ASF.Downloaded == True,
+                                                             EDDSentinel1ASF.ARDProduct == False,
+                                                             EDDSentinel1ASF.Invalid == False).order_by(
+                                                             EDDSentinel1ASF.Acquisition_Date.asc()).yield_per(1000)
 
-        scns2ard = list()
-        if query_result is not None:
-            for record in query_result:
-                scns2ard.append(record.PID)
+        scns2ard = [record.PID for record in query_result]
         ses.close()
         logger.debug("Closed the database session.")
         return scns2ard
@@ -746,12 +1175,10 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param unq_id: the unique ID of the scene of interest.
         :return: boolean (True: has been converted. False: Has not been converted)
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
         logger.debug("Perform query to find scene.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one()
+        query_result = ses.query(EDDSentinel1ASF.ARDProduct, EDDSentinel1ASF.Invalid).filter(
+                EDDSentinel1ASF.PID == unq_id).one()
         ses.close()
         logger.debug("Closed the database session.")
         return (query_result.ARDProduct == True) and (query_result.Invalid == False)
@@ -773,15 +1200,12 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
 
         eodd_utils = eodatadown.eodatadownutils.EODataDownUtils()
 
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
 
         logger.debug("Perform query to find scenes which need converting to ARD.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id,
-                                                         EDDSentinel1ASF.Downloaded == True,
-                                                         EDDSentinel1ASF.ARDProduct == False).one_or_none()
+        query_result = ses.query(EDDSentinel1ASF).options(_S1ASF_ARD_LOAD_COLS).filter(
+                EDDSentinel1ASF.PID == unq_id, EDDSentinel1ASF.Downloaded == True,
+                EDDSentinel1ASF.ARDProduct == False).one_or_none()
 
         proj_epsg = None
         if self.ardProjDefined:
@@ -792,29 +1216,26 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
             logger.debug("Create the specific output directories for the ARD processing.")
             dt_obj = datetime.datetime.now()
 
-            tmp_ard_path = os.path.join(self.ardProdTmpPath, dt_obj.strftime("%Y-%m-%d"))
-            if not os.path.exists(tmp_ard_path):
-                os.mkdir(tmp_ard_path)
+            dt_str = dt_obj.strftime("%Y-%m-%d")
 
-            wrk_ard_path = os.path.join(self.ardProdWorkPath, dt_obj.strftime("%Y-%m-%d"))
-            if not os.path.exists(wrk_ard_path):
-                os.mkdir(wrk_ard_path)
+            tmp_ard_path = os.path.join(self.ardProdTmpPath, dt_str)
+            os.makedirs(tmp_ard_path, exist_ok=True)
+
+            wrk_ard_path = os.path.join(self.ardProdWorkPath, dt_str)
+            os.makedirs(wrk_ard_path, exist_ok=True)
 
             logger.debug("Create info for running ARD analysis for scene: {}".format(query_result.Product_File_ID))
             final_ard_scn_path = os.path.join(self.ardFinalPath,
                                               "{}_{}".format(query_result.Product_File_ID, query_result.PID))
-            if not os.path.exists(final_ard_scn_path):
-                os.mkdir(final_ard_scn_path)
+            os.makedirs(final_ard_scn_path, exist_ok=True)
 
             tmp_ard_scn_path = os.path.join(tmp_ard_path,
                                             "{}_{}".format(query_result.Product_File_ID, query_result.PID))
-            if not os.path.exists(tmp_ard_scn_path):
-                os.mkdir(tmp_ard_scn_path)
+            os.makedirs(tmp_ard_scn_path, exist_ok=True)
 
             wrk_ard_scn_path = os.path.join(wrk_ard_path,
                                             "{}_{}".format(query_result.Product_File_ID, query_result.PID))
-            if not os.path.exists(wrk_ard_scn_path):
-                os.mkdir(wrk_ard_scn_path)
+            os.makedirs(wrk_ard_scn_path, exist_ok=True)
 
             pols = list()
             if 'VV' in query_result.Polarization:
@@ -854,6 +1275,7 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
                 shutil.rmtree(wrk_ard_scn_path)
 
         ses.close()
+        self._clear_query_caches()
 
 
     def scns2ard_all_avail(self, n_cores):
@@ -878,47 +1300,43 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
 
         eodd_utils = eodatadown.eodatadownutils.EODataDownUtils()
 
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
+        # The objects are not expired when each record is committed so a SELECT
+        # is not issued to refresh every object after each commit.
+        ses.expire_on_commit = False
 
         logger.debug("Perform query to find scenes which need converting to ARD.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Downloaded == True,
-                                                         EDDSentinel1ASF.ARDProduct == False,
-                                                         EDDSentinel1ASF.Invalid == False).all()
+        query_result = ses.query(EDDSentinel1ASF).options(_S1ASF_ARD_LOAD_COLS).filter(
+                EDDSentinel1ASF.Downloaded == True, EDDSentinel1ASF.ARDProduct == False,
+                EDDSentinel1ASF.Invalid == False).all()
 
         proj_epsg = None
         if self.ardProjDefined:
             proj_epsg = self.projEPSG
 
-        if query_result is not None:
-            logger.debug("Create the specific output directories for the ARD processing.")
-
+        if query_result:
             logger.debug("Create the specific output directories for the ARD processing.")
             dt_obj = datetime.datetime.now()
 
-            tmp_ard_path = os.path.join(self.ardProdTmpPath, dt_obj.strftime("%Y-%m-%d"))
-            if not os.path.exists(tmp_ard_path):
-                os.mkdir(tmp_ard_path)
+            dt_str = dt_obj.strftime("%Y-%m-%d")
+
+            tmp_ard_path = os.path.join(self.ardProdTmpPath, dt_str)
+            os.makedirs(tmp_ard_path, exist_ok=True)
 
-            wrk_ard_path = os.path.join(self.ardProdWorkPath, dt_obj.strftime("%Y-%m-%d"))
-            if not os.path.exists(wrk_ard_path):
-                os.mkdir(wrk_ard_path)
+            wrk_ard_path = os.path.join(self.ardProdWorkPath, dt_str)
+            os.makedirs(wrk_ard_path, exist_ok=True)
 
             for record in query_result:
                 start_date = datetime.datetime.now()
-                final_ard_scn_path = os.path.join(self.ardFinalPath, "{}_{}".format(record.Product_File_ID, record.PID))
-                if not os.path.exists(final_ard_scn_path):
-                    os.mkdir(final_ard_scn_path)
+                scn_dir_name = "{}_{}".format(record.Product_File_ID, record.PID)
+                final_ard_scn_path = os.path.join(self.ardFinalPath, scn_dir_name)
+                os.makedirs(final_ard_scn_path, exist_ok=True)
 
-                tmp_ard_scn_path = os.path.join(tmp_ard_path, "{}_{}".format(record.Product_File_ID, record.PID))
-                if not os.path.exists(tmp_ard_scn_path):
-                    os.mkdir(tmp_ard_scn_path)
+                tmp_ard_scn_path = os.path.join(tmp_ard_path, scn_dir_name)
+                os.makedirs(tmp_ard_scn_path, exist_ok=True)
 
-                wrk_ard_scn_path = os.path.join(wrk_ard_path, "{}_{}".format(record.Product_File_ID, record.PID))
-                if not os.path.exists(wrk_ard_scn_path):
-                    os.mkdir(wrk_ard_scn_path)
+                wrk_ard_scn_path = os.path.join(wrk_ard_path, scn_dir_name)
+                os.makedirs(wrk_ard_scn_path, exist_ok=True)
 
                 pols = list()
                 if 'VV' in record.Polarization:
@@ -958,6 +1376,7 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
                 if os.path.exists(wrk_ard_scn_path):
                     shutil.rmtree(wrk_ard_scn_path)
         ses.close()
+        self._clear_query_caches()
 
     def get_scnlist_datacube(self, loaded=False):
         """
@@ -965,19 +1384,13 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         but have not yet been loaded into the system datacube (specifed in the configuration file).
         :return: A list of unq_ids for the scenes. The list will be empty if there are no scenes to be loaded.
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
 
         logger.debug("Perform query to find scenes which need converting to ARD.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.ARDProduct == True,
-                                                         EDDSentinel1ASF.DCLoaded == loaded).order_by(
-                                                         EDDSentinel1ASF.Acquisition_Date.asc()).all()
-        scns2dcload = list()
-        if query_result is not None:
-            for record in query_result:
-                scns2dcload.append(record.PID)
+        query_result = ses.query(EDDSentinel1ASF.PID).filter(EDDSentinel1ASF.ARDProduct == True,
+                                                             EDDSentinel1ASF.DCLoaded == loaded).order_by(
+                                                             EDDSentinel1ASF.Acquisition_Date.asc()).yield_per(1000)
+        scns2dcload = [record.PID for record in query_result]
         ses.close()
         logger.debug("Closed the database session.")
         return scns2dcload
@@ -988,12 +1401,9 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param unq_id: the unique ID of the scene.
         :return: boolean (True: Loaded in DataCube. False: Not loaded in DataCube)
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
+        ses = self._get_session()
         logger.debug("Perform query to find scene.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one()
+        query_result = ses.query(EDDSentinel1ASF.DCLoaded).filter(EDDSentinel1ASF.PID == unq_id).one()
         ses.close()
         logger.debug("Closed the database session.")
         return query_result.DCLoaded
@@ -1021,22 +1431,15 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         """
         scns2quicklook = list()
         if self.calc_scn_quicklook():
-            logger.debug("Creating Database Engine and Session.")
-            db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-            session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-            ses = session_sqlalc()
-            logger.debug("Perform query to find scene.")
-            query_result = ses.query(EDDSentinel1ASF).filter(
-                sqlalchemy.or_(
-                    EDDSentinel1ASF.ExtendedInfo.is_(None),
-                    sqlalchemy.not_(EDDSentinel1ASF.ExtendedInfo.has_key('quicklook'))),
-                EDDSentinel1ASF.Invalid == False,
-                EDDSentinel1ASF.ARDProduct == True).order_by(EDDSentinel1ASF.Acquisition_Date.asc()).all()
-            if query_result is not None:
-                for record in query_result:
-                    scns2quicklook.append(record.PID)
-            ses.close()
-            logger.debug("Closed the database session.")
+            with self._session() as ses:
+                logger.debug("Perform query to find scene.")
+                query_result = ses.query(EDDSentinel1ASF.PID).filter(
+                    sqlalchemy.or_(
+                        EDDSentinel1ASF.ExtendedInfo.is_(None),
+                        sqlalchemy.not_(EDDSentinel1ASF.ExtendedInfo.has_key('quicklook'))),
+                    EDDSentinel1ASF.Invalid == False,
+                    EDDSentinel1ASF.ARDProduct == True).order_by(EDDSentinel1ASF.Acquisition_Date.asc()).yield_per(500)
+                scns2quicklook = [record.PID for record in query_result]
         return scns2quicklook
 
     def has_scn_quicklook(self, unq_id):
@@ -1046,15 +1449,12 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param unq_id: integer unique ID for the scene.
         :return: boolean (True = has quicklook. False = has not got a quicklook)
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one()
-        scn_json = query_result.ExtendedInfo
-        ses.close()
-        logger.debug("Closed the database session.")
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            query_result = ses.get(EDDSentinel1ASF, unq_id)
+            if query_result is None:
+                raise EODataDownException("Scene ('{}') could not be found in database".format(unq_id))
+            scn_json = query_result.ExtendedInfo
 
         quicklook_calcd = False
         if scn_json is not None:
@@ -1074,65 +1474,59 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         if not os.path.exists(self.ardProdTmpPath):
             raise EODataDownException("The tmp path does not exist, please create and run again.")
 
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one_or_none()
-        if query_result is not None:
-            if not query_result.ARDProduct:
-                raise EODataDownException("Cannot create a quicklook as an ARD product has not been created.")
-            if query_result.Invalid:
-                raise EODataDownException("Cannot create a quicklook as image has been assigned as 'invalid'.")
-
-            scn_json = query_result.ExtendedInfo
-            if (scn_json is None) or (scn_json == ""):
-                scn_json = dict()
-
-            ard_img_path = query_result.ARDProduct_Path
-            eodd_utils = eodatadown.eodatadownutils.EODataDownUtils()
-            ard_img_file = eodd_utils.findFile(ard_img_path, '*dB*.tif')
-
-            out_quicklook_path = os.path.join(self.quicklookPath,
-                                              "{}_{}".format(query_result.Product_File_ID, query_result.PID))
-            if not os.path.exists(out_quicklook_path):
-                os.mkdir(out_quicklook_path)
-
-            tmp_quicklook_path = os.path.join(self.ardProdTmpPath,
-                                              "quicklook_{}_{}".format(query_result.Product_File_ID, query_result.PID))
-            if not os.path.exists(tmp_quicklook_path):
-                os.mkdir(tmp_quicklook_path)
-
-            # VV, VH, VV/VH
-            bands = '1,2,3'
-
-            ard_img_basename = os.path.splitext(os.path.basename(ard_img_file))[0]
-
-            quicklook_imgs = list()
-            quicklook_imgs.append(os.path.join(out_quicklook_path, "{}_250px.jpg".format(ard_img_basename)))
-            quicklook_imgs.append(os.path.join(out_quicklook_path, "{}_1000px.jpg".format(ard_img_basename)))
-
-            import rsgislib.tools.visualisation
-            rsgislib.tools.visualisation.createQuicklookImgs(ard_img_file, bands, outputImgs=quicklook_imgs,
-                                                             output_img_sizes=[250, 1000],  scale_axis='auto',
-                                                             img_stats_msk=None, img_msk_vals=1,
-                                                             stretch_file=self.std_vis_img_stch,
-                                                             tmp_dir=tmp_quicklook_path)
-
-            if not ("quicklook" in scn_json):
-                scn_json["quicklook"] = dict()
-
-            scn_json["quicklook"]["quicklookpath"] = out_quicklook_path
-            scn_json["quicklook"]["quicklookimgs"] = quicklook_imgs
-            query_result.ExtendedInfo = scn_json
-            flag_modified(query_result, "ExtendedInfo")
-            ses.add(query_result)
-            ses.commit()
-        else:
-            raise EODataDownException("Could not find input image with PID {}".format(unq_id))
-        ses.close()
-        logger.debug("Closed the database session.")
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            query_result = ses.get(EDDSentinel1ASF, unq_id)
+            if query_result is not None:
+                if not query_result.ARDProduct:
+                    raise EODataDownException("Cannot create a quicklook as an ARD product has not been created.")
+                if query_result.Invalid:
+                    raise EODataDownException("Cannot create a quicklook as image has been assigned as 'invalid'.")
+
+                scn_json = query_result.ExtendedInfo
+                if (scn_json is None) or (scn_json == ""):
+                    scn_json = dict()
+
+                ard_img_path = query_result.ARDProduct_Path
+                eodd_utils = eodatadown.eodatadownutils.EODataDownUtils()
+                ard_img_file = eodd_utils.findFile(ard_img_path, '*dB*.tif')
+
+                out_quicklook_path = os.path.join(self.quicklookPath,
+                                                  "{}_{}".format(query_result.Product_File_ID, query_result.PID))
+                os.makedirs(out_quicklook_path, exist_ok=True)
+
+                tmp_quicklook_path = os.path.join(self.ardProdTmpPath,
+                                                  "quicklook_{}_{}".format(query_result.Product_File_ID, query_result.PID))
+                os.makedirs(tmp_quicklook_path, exist_ok=True)
+
+                # VV, VH, VV/VH
+                bands = '1,2,3'
+
+                ard_img_basename = os.path.splitext(os.path.basename(ard_img_file))[0]
+
+                quicklook_imgs = list()
+                quicklook_imgs.append(os.path.join(out_quicklook_path, "{}_250px.jpg".format(ard_img_basename)))
+                quicklook_imgs.append(os.path.join(out_quicklook_path, "{}_1000px.jpg".format(ard_img_basename)))
+
+                if rsgis_vis is None:
+                    raise EODataDownException("The rsgislib.tools.visualisation module could not be imported.")
+                rsgis_vis.createQuicklookImgs(ard_img_file, bands, outputImgs=quicklook_imgs,
+                                              output_img_sizes=[250, 1000],  scale_axis='auto',
+                                              img_stats_msk=None, img_msk_vals=1,
+                                              stretch_file=self.std_vis_img_stch,
+                                              tmp_dir=tmp_quicklook_path)
+
+                if not ("quicklook" in scn_json):
+                    scn_json["quicklook"] = dict()
+
+                scn_json["quicklook"]["quicklookpath"] = out_quicklook_path
+                scn_json["quicklook"]["quicklookimgs"] = quicklook_imgs
+                query_result.ExtendedInfo = scn_json
+                flag_modified(query_result, "ExtendedInfo")
+                ses.add(query_result)
+                ses.commit()
+            else:
+                raise EODataDownException("Could not find input image with PID {}".format(unq_id))
 
     def scns2quicklook_all_avail(self):
         """
@@ -1151,22 +1545,15 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         """
         scns2tilecache = list()
         if self.calc_scn_tilecache():
-            logger.debug("Creating Database Engine and Session.")
-            db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-            session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-            ses = session_sqlalc()
-            logger.debug("Perform query to find scene.")
-            query_result = ses.query(EDDSentinel1ASF).filter(
-                sqlalchemy.or_(
-                    EDDSentinel1ASF.ExtendedInfo.is_(None),
-                    sqlalchemy.not_(EDDSentinel1ASF.ExtendedInfo.has_key('tilecache'))),
-                EDDSentinel1ASF.Invalid == False,
-                EDDSentinel1ASF.ARDProduct == True).order_by(EDDSentinel1ASF.Acquisition_Date.asc()).all()
-            if query_result is not None:
-                for record in query_result:
-                    scns2tilecache.append(record.PID)
-            ses.close()
-            logger.debug("Closed the database session.")
+            with self._session() as ses:
+                logger.debug("Perform query to find scene.")
+                query_result = ses.query(EDDSentinel1ASF.PID).filter(
+                    sqlalchemy.or_(
+                        EDDSentinel1ASF.ExtendedInfo.is_(None),
+                        sqlalchemy.not_(EDDSentinel1ASF.ExtendedInfo.has_key('tilecache'))),
+                    EDDSentinel1ASF.Invalid == False,
+                    EDDSentinel1ASF.ARDProduct == True).order_by(EDDSentinel1ASF.Acquisition_Date.asc()).yield_per(500)
+                scns2tilecache = [record.PID for record in query_result]
         return scns2tilecache
 
     def has_scn_tilecache(self, unq_id):
@@ -1176,15 +1563,12 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param unq_id: integer unique ID for the scene.
         :return: boolean (True = has tile cache. False = has not got a tile cache)
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one()
-        scn_json = query_result.ExtendedInfo
-        ses.close()
-        logger.debug("Closed the database session.")
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            query_result = ses.get(EDDSentinel1ASF, unq_id)
+            if query_result is None:
+                raise EODataDownException("Scene ('{}') could not be found in database".format(unq_id))
+            scn_json = query_result.ExtendedInfo
 
         tile_cache_calcd = False
         if scn_json is not None:
@@ -1204,63 +1588,57 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         if not os.path.exists(self.ardProdTmpPath):
             raise EODataDownException("The tmp path does not exist, please create and run again.")
 
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one_or_none()
-        if query_result is not None:
-            if not query_result.ARDProduct:
-                raise EODataDownException("Cannot create a tilecache as an ARD product has not been created.")
-            if query_result.Invalid:
-                raise EODataDownException("Cannot create a tilecache as image has been assigned as 'invalid'.")
-
-            scn_json = query_result.ExtendedInfo
-            if (scn_json is None) or (scn_json == ""):
-                scn_json = dict()
-
-            ard_img_path = query_result.ARDProduct_Path
-            eodd_utils = eodatadown.eodatadownutils.EODataDownUtils()
-            ard_img_file = eodd_utils.findFile(ard_img_path, '*dB*.tif')
-
-            out_tilecache_dir = os.path.join(self.tilecachePath,
-                                            "{}_{}".format(query_result.Product_File_ID, query_result.PID))
-            if not os.path.exists(out_tilecache_dir):
-                os.mkdir(out_tilecache_dir)
-
-            out_visual_gtiff = os.path.join(out_tilecache_dir,
-                                            "{}_{}_vis.tif".format(query_result.Product_File_ID, query_result.PID))
-
-            tmp_tilecache_path = os.path.join(self.ardProdTmpPath,
-                                            "tilecache_{}_{}".format(query_result.Product_File_ID, query_result.PID))
-            if not os.path.exists(tmp_tilecache_path):
-                os.mkdir(tmp_tilecache_path)
-
-            # VV, VH, VV/VH
-            bands = '1,2,3'
-
-            import rsgislib.tools.visualisation
-            rsgislib.tools.visualisation.createWebTilesVisGTIFFImg(ard_img_file, bands, out_tilecache_dir,
-                                                                   out_visual_gtiff, zoomLevels='2-12',
-                                                                   img_stats_msk=None, img_msk_vals=1,
-                                                                   stretch_file=self.std_vis_img_stch,
-                                                                   tmp_dir=tmp_tilecache_path, webview=True,
-                                                                   scale=50)
-
-            if not ("tilecache" in scn_json):
-                scn_json["tilecache"] = dict()
-            scn_json["tilecache"]["tilecachepath"] = out_tilecache_dir
-            scn_json["tilecache"]["visgtiff"] = out_visual_gtiff
-            query_result.ExtendedInfo = scn_json
-            flag_modified(query_result, "ExtendedInfo")
-            ses.add(query_result)
-            ses.commit()
-        else:
-            raise EODataDownException("Could not find input image with PID {}".format(unq_id))
-        ses.close()
-        logger.debug("Closed the database session.")
-        shutil.rmtree(tmp_tilecache_path)
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            query_result = ses.get(EDDSentinel1ASF, unq_id)
+            if query_result is not None:
+                if not query_result.ARDProduct:
+                    raise EODataDownException("Cannot create a tilecache as an ARD product has not been created.")
+                if query_result.Invalid:
+                    raise EODataDownException("Cannot create a tilecache as image has been assigned as 'invalid'.")
+
+                scn_json = query_result.ExtendedInfo
+                if (scn_json is None) or (scn_json == ""):
+                    scn_json = dict()
+
+                ard_img_path = query_result.ARDProduct_Path
+                eodd_utils = eodatadown.eodatadownutils.EODataDownUtils()
+                ard_img_file = eodd_utils.findFile(ard_img_path, '*dB*.tif')
+
+                out_tilecache_dir = os.path.join(self.tilecachePath,
+                                                "{}_{}".format(query_result.Product_File_ID, query_result.PID))
+                os.makedirs(out_tilecache_dir, exist_ok=True)
+
+                out_visual_gtiff = os.path.join(out_tilecache_dir,
+                                                "{}_{}_vis.tif".format(query_result.Product_File_ID, query_result.PID))
+
+                tmp_tilecache_path = os.path.join(self.ardProdTmpPath,
+                                                "tilecache_{}_{}".format(query_result.Product_File_ID, query_result.PID))
+                os.makedirs(tmp_tilecache_path, exist_ok=True)
+
+                # VV, VH, VV/VH
+                bands = '1,2,3'
+
+                if rsgis_vis is None:
+                    raise EODataDownException("The rsgislib.tools.visualisation module could not be imported.")
+                rsgis_vis.createWebTilesVisGTIFFImg(ard_img_file, bands, out_tilecache_dir,
+                                                    out_visual_gtiff, zoomLevels='2-12',
+                                                    img_stats_msk=None, img_msk_vals=1,
+                                                    stretch_file=self.std_vis_img_stch,
+                                                    tmp_dir=tmp_tilecache_path, webview=True,
+                                                    scale=50)
+
+                if not ("tilecache" in scn_json):
+                    scn_json["tilecache"] = dict()
+                scn_json["tilecache"]["tilecachepath"] = out_tilecache_dir
+                scn_json["tilecache"]["visgtiff"] = out_visual_gtiff
+                query_result.ExtendedInfo = scn_json
+                flag_modified(query_result, "ExtendedInfo")
+                ses.add(query_result)
+                ses.commit()
+                shutil.rmtree(tmp_tilecache_path)
+            else:
+                raise EODataDownException("Could not find input image with PID {}".format(unq_id))
 
     def scns2tilecache_all_avail(self):
         """
@@ -1276,24 +1654,10 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param unq_id:
         :return: Returns the database record object
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-
-        logger.debug("Perform query to find scene.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).all()
-        ses.close()
-        scn_record = None
-        if query_result is not None:
-            if len(query_result) == 1:
-                scn_record = query_result[0]
-            else:
-                logger.error(
-                    "PID {0} has returned more than 1 scene - must be unique something really wrong.".format(unq_id))
-                raise EODataDownException(
-                    "There was more than 1 scene which has been found - something has gone really wrong!")
-        else:
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            scn_record = ses.get(EDDSentinel1ASF, unq_id)
+        if scn_record is None:
             logger.error("PID {0} has not returned a scene - check inputs.".format(unq_id))
             raise EODataDownException("PID {0} has not returned a scene - check inputs.".format(unq_id))
         return scn_record
@@ -1306,28 +1670,13 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :return: a datetime object.
 
         """
-        import copy
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).all()
-        ses.close()
-        scn_record = None
-        if query_result is not None:
-            if len(query_result) == 1:
-                scn_record = query_result[0]
-            else:
-                logger.error(
-                        "PID {0} has returned more than 1 scene - must be unique something really wrong.".format(
-                            unq_id))
-                raise EODataDownException(
-                        "There was more than 1 scene which has been found - something has gone really wrong!")
-        else:
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            scn_record = ses.get(EDDSentinel1ASF, unq_id)
+        if scn_record is None:
             logger.error("PID {0} has not returned a scene - check inputs.".format(unq_id))
             raise EODataDownException("PID {0} has not returned a scene - check inputs.".format(unq_id))
-        return copy.copy(scn_record.BeginPosition)
+        return scn_record.BeginPosition
 
     def get_scnlist_usr_analysis(self):
         """
@@ -1337,51 +1686,40 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         """
         scns2runusranalysis = list()
         if self.calc_scn_usr_analysis():
-            logger.debug("Creating Database Engine and Session.")
-            db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-            session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-            ses = session_sqlalc()
-
-            usr_analysis_keys = self.get_usr_analysis_keys()
+            with self._session() as ses:
+                usr_analysis_keys = self.get_usr_analysis_keys()
 
-            query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Invalid == False,
-                                                             EDDSentinel1ASF.ARDProduct == True).order_by(
-                                                             EDDSentinel1ASF.Acquisition_Date.asc()).all()
+                query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Invalid == False,
+                                                                 EDDSentinel1ASF.ARDProduct == True).order_by(
+                                                                 EDDSentinel1ASF.Acquisition_Date.asc()).all()
 
-            for scn in query_result:
-                scn_plgin_db_objs = ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.Scene_PID == scn.PID).all()
-                if (scn_plgin_db_objs is None) or (not scn_plgin_db_objs):
-                    scns2runusranalysis.append(scn.PID)
-                else:
-                    for plugin_key in usr_analysis_keys:
-                        plugin_completed = False
-                        for plgin_db_obj in scn_plgin_db_objs:
-                            if (plgin_db_obj.PlugInName == plugin_key) and plgin_db_obj.Completed:
-                                plugin_completed = True
+                for scn in query_result:
+                    scn_plgin_db_objs = ses.execute(_SCN_PLUGINS_BY_PID, {"scn_pid": scn.PID}).scalars().all()
+                    if (scn_plgin_db_objs is None) or (not scn_plgin_db_objs):
+                        scns2runusranalysis.append(scn.PID)
+                    else:
+                        for plugin_key in usr_analysis_keys:
+                            plugin_completed = False
+                            for plgin_db_obj in scn_plgin_db_objs:
+                                if (plgin_db_obj.PlugInName == plugin_key) and plgin_db_obj.Completed:
+                                    plugin_completed = True
+                                    break
+                            if not plugin_completed:
+                                scns2runusranalysis.append(scn.PID)
                                 break
-                        if not plugin_completed:
-                            scns2runusranalysis.append(scn.PID)
-                            break
-            ses.close()
-            logger.debug("Closed the database session.")
         return scns2runusranalysis
 
     def has_scn_usr_analysis(self, unq_id):
         usr_plugins_calcd = True
         logger.debug("Going to test whether there are plugins to execute.")
         if self.calc_scn_usr_analysis():
-            logger.debug("Creating Database Engine and Session.")
-            db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-            session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-            ses = session_sqlalc()
-            logger.debug("Perform query to find scene.")
-            query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one_or_none()
-            if query_result is None:
-                raise EODataDownException("Scene ('{}') could not be found in database".format(unq_id))
+            with self._session() as ses:
+                logger.debug("Perform query to find scene.")
+                query_result = ses.get(EDDSentinel1ASF, unq_id)
+                if query_result is None:
+                    raise EODataDownException("Scene ('{}') could not be found in database".format(unq_id))
 
-            scn_plgin_db_objs = ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.Scene_PID == unq_id).all()
-            ses.close()
-            logger.debug("Closed the database session.")
+                scn_plgin_db_objs = ses.execute(_SCN_PLUGINS_BY_PID, {"scn_pid": unq_id}).scalars().all()
             if (scn_plgin_db_objs is None) or (not scn_plgin_db_objs):
                 usr_plugins_calcd = False
             else:
@@ -1441,20 +1779,14 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
                     plugin_cls_inst.set_users_param(plugin_info["params"])
                     logger.debug("Read plugin params and passed to plugin.")
 
-                logger.debug("Creating Database Engine and Session.")
-                db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-                session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-                ses = session_sqlalc()
-                logger.debug("Perform query to find scene.")
-                scn_db_obj = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one_or_none()
-                if scn_db_obj is None:
-                    raise EODataDownException("Scene ('{}') could not be found in database".format(unq_id))
-                logger.debug("Perform query to find scene in plugin DB.")
-                plgin_db_obj = ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.Scene_PID == unq_id,
-                                                                        EDDSentinel1ASFPlugins.PlugInName == plugin_key).one_or_none()
-                plgin_db_objs = ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.Scene_PID == unq_id).all()
-                ses.close()
-                logger.debug("Closed the database session.")
+                with self._session() as ses:
+                    logger.debug("Perform query to find scene.")
+                    scn_db_obj = ses.get(EDDSentinel1ASF, unq_id)
+                    if scn_db_obj is None:
+                        raise EODataDownException("Scene ('{}') could not be found in database".format(unq_id))
+                    logger.debug("Perform query to find scene in plugin DB.")
+                    plgin_db_obj = ses.get(EDDSentinel1ASFPlugins, (unq_id, plugin_key))
+                    plgin_db_objs = ses.execute(_SCN_PLUGINS_BY_PID, {"scn_pid": unq_id}).scalars().all()
 
                 plgins_dict = dict()
                 for plgin_obj in plgin_db_objs:
@@ -1489,32 +1821,26 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
                         logger.debug("The plugin analysis has been completed - UNSUCCESSFULLY.")
 
                     if exists_in_db:
-                        logger.debug("Creating Database Engine and Session.")
-                        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-                        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-                        ses = session_sqlalc()
-                        logger.debug("Perform query to find scene in plugin DB.")
-                        plgin_db_obj = ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.Scene_PID == unq_id,
-                                                                                EDDSentinel1ASFPlugins.PlugInName == plugin_key).one_or_none()
-
-                        if plgin_db_obj is None:
-                            raise EODataDownException(
-                                    "Do not know what has happened, scene plugin instance not found but was earlier.")
-
-                        plgin_db_obj.Success = plg_success
-                        plgin_db_obj.Completed = completed
-                        plgin_db_obj.Outputs = plg_outputs
-                        plgin_db_obj.Error = error_occurred
-                        plgin_db_obj.Start_Date = start_time
-                        plgin_db_obj.End_Date = end_time
-                        if out_dict is not None:
-                            plgin_db_obj.ExtendedInfo = out_dict
-                            flag_modified(plgin_db_obj, "ExtendedInfo")
-                        ses.add(plgin_db_obj)
-                        ses.commit()
-                        logger.debug("Committed updated record to database - PID {}.".format(unq_id))
-                        ses.close()
-                        logger.debug("Closed the database session.")
+                        with self._session() as ses:
+                            logger.debug("Perform query to find scene in plugin DB.")
+                            plgin_db_obj = ses.get(EDDSentinel1ASFPlugins, (unq_id, plugin_key))
+
+                            if plgin_db_obj is None:
+                                raise EODataDownException(
+                                        "Do not know what has happened, scene plugin instance not found but was earlier.")
+
+                            plgin_db_obj.Success = plg_success
+                            plgin_db_obj.Completed = completed
+                            plgin_db_obj.Outputs = plg_outputs
+                            plgin_db_obj.Error = error_occurred
+                            plgin_db_obj.Start_Date = start_time
+                            plgin_db_obj.End_Date = end_time
+                            if out_dict is not None:
+                                plgin_db_obj.ExtendedInfo = out_dict
+                                flag_modified(plgin_db_obj, "ExtendedInfo")
+                            ses.add(plgin_db_obj)
+                            ses.commit()
+                            logger.debug("Committed updated record to database - PID {}.".format(unq_id))
                     else:
                         plgin_db_obj = EDDSentinel1ASFPlugins(Scene_PID=scn_db_obj.PID, PlugInName=plugin_key,
                                                               Start_Date=start_time, End_Date=end_time,
@@ -1523,14 +1849,10 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
                         if out_dict is not None:
                             plgin_db_obj.ExtendedInfo = out_dict
 
-                        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-                        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-                        ses = session_sqlalc()
-                        ses.add(plgin_db_obj)
-                        ses.commit()
-                        logger.debug("Committed new record to database - PID {}.".format(unq_id))
-                        ses.close()
-                        logger.debug("Closed the database session.")
+                        with self._session() as ses:
+                            ses.add(plgin_db_obj)
+                            ses.commit()
+                            logger.debug("Committed new record to database - PID {}.".format(unq_id))
                 else:
                     logger.debug("The plugin '{}' from '{}' has already been run so will not be run again".format(
                             plugin_cls_name, plugin_module_name))
@@ -1558,29 +1880,24 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
             logger.debug("There are {} plugins to reset".format(len(plgin_lst)))
 
             if len(plgin_lst) > 0:
-                logger.debug("Creating Database Engine and Session.")
-                db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-                session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-                ses = session_sqlalc()
-
-                if scn_pid is None:
-                    logger.debug("No scene PID has been provided so resetting all the scenes.")
-                    for plgin_key in plgin_lst:
-                        ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.PlugInName == plgin_key).delete(synchronize_session=False)
-                        ses.commit()
-                else:
-                    logger.debug("Scene PID {} has been provided so resetting.".format(scn_pid))
-                    if reset_all_plgins:
-                        ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.Scene_PID == scn_pid).delete(synchronize_session=False)
+                with self._session() as ses:
+                    if scn_pid is None:
+                        logger.debug("No scene PID has been provided so resetting all the scenes.")
+                        for plgin_key in plgin_lst:
+                            ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.PlugInName == plgin_key).delete(synchronize_session=False)
+                            ses.commit()
                     else:
-                        scn_plgin_db_objs = ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.Scene_PID == scn_pid).all()
-                        if (scn_plgin_db_objs is None) and (not scn_plgin_db_objs):
-                            raise EODataDownException("Scene ('{}') could not be found in database".format(scn_pid))
-                        for plgin_db_obj in scn_plgin_db_objs:
-                            if plgin_db_obj.PlugInName in plgin_lst:
-                                ses.delete(plgin_db_obj)
-                    ses.commit()
-                ses.close()
+                        logger.debug("Scene PID {} has been provided so resetting.".format(scn_pid))
+                        if reset_all_plgins:
+                            ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.Scene_PID == scn_pid).delete(synchronize_session=False)
+                        else:
+                            scn_plgin_db_objs = ses.execute(_SCN_PLUGINS_BY_PID, {"scn_pid": scn_pid}).scalars().all()
+                            if (scn_plgin_db_objs is None) and (not scn_plgin_db_objs):
+                                raise EODataDownException("Scene ('{}') could not be found in database".format(scn_pid))
+                            for plgin_db_obj in scn_plgin_db_objs:
+                                if plgin_db_obj.PlugInName in plgin_lst:
+                                    ses.delete(plgin_db_obj)
+                        ses.commit()
 
     def is_scn_invalid(self, unq_id):
         """
@@ -1590,17 +1907,12 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :return: True: The scene is invalid. False: the Scene is valid.
 
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one_or_none()
-        if query_result is None:
-            raise EODataDownException("Scene ('{}') could not be found in database".format(unq_id))
-        invalid = query_result.Invalid
-        ses.close()
-        logger.debug("Closed the database session.")
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            query_result = ses.get(EDDSentinel1ASF, unq_id)
+            if query_result is None:
+                raise EODataDownException("Scene ('{}') could not be found in database".format(unq_id))
+            invalid = query_result.Invalid
         return invalid
 
     def get_scn_unq_name(self, unq_id):
@@ -1611,20 +1923,16 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :return: string with a unique name.
 
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one_or_none()
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            query_result = ses.query(EDDSentinel1ASF.Product_File_ID, EDDSentinel1ASF.PID).filter(
+                EDDSentinel1ASF.PID == unq_id).one_or_none()
         if query_result is None:
             raise EODataDownException("Scene ('{}') could not be found in database".format(unq_id))
-        unq_name = "{}_{}".format(query_result.Product_File_ID, query_result.PID)
-        ses.close()
-        logger.debug("Closed the database session.")
-        return unq_name
+        return f"{query_result.Product_File_ID}_{query_result.PID}"
 
-    def get_scn_unq_name_record(self, scn_record):
+    @staticmethod
+    def get_scn_unq_name_record(scn_record):
         """
         A function which returns a name which will be unique using the scene record object passed to the function.
 
@@ -1632,20 +1940,55 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :return: string with a unique name.
 
         """
-        unq_name = "{}_{}".format(scn_record.Product_File_ID, scn_record.PID)
-        return unq_name
+        return f"{scn_record.Product_File_ID}_{scn_record.PID}"
 
     def find_unique_platforms(self):
         """
         A function which returns a list of unique platforms within the database (e.g., Sentinel1A or Sentinel1B).
+        The result is cached until the scenes within the database are modified by this object or
+        the cache expires.
         :return: list of strings.
         """
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        platforms = ses.query(EDDSentinel1ASF.Platform).group_by(EDDSentinel1ASF.Platform)
-        ses.close()
-        return platforms
+        if (self._platforms_cache is None) or \
+                ((time.monotonic() - self._platforms_cache[0]) >= self._query_cache_ttl):
+            with self._session() as ses:
+                self._platforms_cache = (time.monotonic(), ses.query(EDDSentinel1ASF.Platform).distinct().all())
+        return list(self._platforms_cache[1])
+
+    def _date_filters(self, start_date, end_date, valid):
+        """
+        A function which creates the filters used to select the scenes within a date range.
+
+        :param start_date: A python datetime object specifying the start date (most recent date)
+        :param end_date: A python datetime object specifying the end date (earliest date)
+        :param valid: If True only valid scenes which have been processed to an ARD product are selected.
+        :return: list of sqlalchemy filter expressions.
+        """
+        # Dates are expected most recent first but also accept them the other way around.
+        if start_date < end_date:
+            start_date, end_date = end_date, start_date
+        filters = [EDDSentinel1ASF.Acquisition_Date.between(end_date, start_date)]
+        if valid:
+            filters.append(EDDSentinel1ASF.Invalid == False)
+            filters.append(EDDSentinel1ASF.ARDProduct == True)
+        return filters
+
+    def _bbox_filters(self, bbox):
+        """
+        A function which creates the filters used to select the scenes which intersect a bounding box.
+
+        :param bbox: Bounding box, with which scenes will intersect [West_Lon, East_Lon, South_Lat, North_Lat]
+        :return: list of sqlalchemy filter expressions.
+        """
+        west_lon_idx = 0
+        east_lon_idx = 1
+        south_lat_idx = 2
+        north_lat_idx = 3
+        return [_bbox_overlap_filter(bbox),
+                (bbox[east_lon_idx] > EDDSentinel1ASF.West_Lon),
+                (EDDSentinel1ASF.East_Lon > bbox[west_lon_idx]),
+                (bbox[north_lat_idx] > EDDSentinel1ASF.South_Lat),
+                (EDDSentinel1ASF.North_Lat > bbox[south_lat_idx])]
 
     def query_scn_records_date_count(self, start_date, end_date, valid=True, cloud_thres=None):
         """
@@ -1658,20 +2001,10 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param cloud_thres: Sentinel-1 isn't effected by cloud so this parameter is ignored.
         :return: count of records available
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        if valid:
-            n_rows = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                       EDDSentinel1ASF.Acquisition_Date >= end_date,
-                                                       EDDSentinel1ASF.Invalid == False,
-                                                       EDDSentinel1ASF.ARDProduct == True).count()
-        else:
-            n_rows = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                       EDDSentinel1ASF.Acquisition_Date >= end_date).count()
-        ses.close()
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            n_rows = ses.query(func.count(EDDSentinel1ASF.PID)).filter(
+                *self._date_filters(start_date, end_date, valid)).scalar()
         return n_rows
 
     def query_scn_records_date(self, start_date, end_date, start_rec=0, n_recs=0, valid=True, cloud_thres=None):
@@ -1685,44 +2018,19 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param n_recs: A parameter specifying the number of records to be returned.
         :param valid: If True only valid scene records will be returned (i.e., has been processed to an ARD product)
         :param cloud_thres: Sentinel-1 isn't effected by cloud so this parameter is ignored.
-        :return: list of database records
+        :return: list of database records (empty if no scenes were found)
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        if valid:
-            if n_recs > 0:
-                query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                                    EDDSentinel1ASF.Acquisition_Date >= end_date,
-                                                                    EDDSentinel1ASF.Invalid == False,
-                                                                    EDDSentinel1ASF.ARDProduct == True).order_by(
-                    EDDSentinel1ASF.Acquisition_Date.desc())[start_rec:(start_rec + n_recs)]
-            else:
-                query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                                    EDDSentinel1ASF.Acquisition_Date >= end_date,
-                                                                    EDDSentinel1ASF.Invalid == False,
-                                                                    EDDSentinel1ASF.ARDProduct == True).order_by(
-                    EDDSentinel1ASF.Acquisition_Date.desc()).all()
-        else:
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            scn_query = ses.query(EDDSentinel1ASF).options(sqlalchemy.orm.raiseload('*')).filter(
+                *self._date_filters(start_date, end_date, valid)).order_by(EDDSentinel1ASF.Acquisition_Date.desc())
             if n_recs > 0:
-                query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                                    EDDSentinel1ASF.Acquisition_Date >= end_date).order_by(
-                    EDDSentinel1ASF.Acquisition_Date.desc())[start_rec:(start_rec + n_recs)]
+                query_result = scn_query.limit(n_recs).offset(start_rec).all()
             else:
-                query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                                    EDDSentinel1ASF.Acquisition_Date >= end_date).order_by(
-                    EDDSentinel1ASF.Acquisition_Date.desc()).all()
-        ses.close()
-        scn_records = list()
-        if (query_result is not None) and (len(query_result) > 0):
-            for rec in query_result:
-                scn_records.append(rec)
-        else:
-            logger.error("No scenes were found within this date range.")
-            raise EODataDownException("No scenes were found within this date range.")
-        return scn_records
+                query_result = scn_query.all()
+        if not query_result:
+            logger.debug("No scenes were found within this date range.")
+        return query_result
 
     def query_scn_records_date_bbox_count(self, start_date, end_date, bbox, valid=True, cloud_thres=None):
         """
@@ -1736,33 +2044,10 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param cloud_thres: Sentinel-1 isn't effected by cloud so this parameter is ignored.
         :return: count of records available
         """
-        west_lon_idx = 0
-        east_lon_idx = 1
-        south_lat_idx = 2
-        north_lat_idx = 3
-
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        if valid:
-            n_rows = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                       EDDSentinel1ASF.Acquisition_Date >= end_date,
-                                                       EDDSentinel1ASF.Invalid == False,
-                                                       EDDSentinel1ASF.ARDProduct == True).filter(
-                                                       (bbox[east_lon_idx] > EDDSentinel1ASF.West_Lon),
-                                                       (EDDSentinel1ASF.East_Lon > bbox[west_lon_idx]),
-                                                       (bbox[north_lat_idx] > EDDSentinel1ASF.South_Lat),
-                                                       (EDDSentinel1ASF.North_Lat > bbox[south_lat_idx])).count()
-        else:
-            n_rows = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                       EDDSentinel1ASF.Acquisition_Date >= end_date).filter(
-                                                       (bbox[east_lon_idx] > EDDSentinel1ASF.West_Lon),
-                                                       (EDDSentinel1ASF.East_Lon > bbox[west_lon_idx]),
-                                                       (bbox[north_lat_idx] > EDDSentinel1ASF.South_Lat),
-                                                       (EDDSentinel1ASF.North_Lat > bbox[south_lat_idx])).count()
-        ses.close()
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            n_rows = ses.query(func.count(EDDSentinel1ASF.PID)).filter(
+                *self._date_filters(start_date, end_date, valid)).filter(*self._bbox_filters(bbox)).scalar()
         return n_rows
 
     def query_scn_records_date_bbox(self, start_date, end_date, bbox, start_rec=0, n_recs=0, valid=True, cloud_thres=None):
@@ -1777,65 +2062,20 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param n_recs: A parameter specifying the number of records to be returned.
         :param valid: If True only valid scene records will be returned (i.e., has been processed to an ARD product)
         :param cloud_thres: Sentinel-1 isn't effected by cloud so this parameter is ignored.
-        :return: list of database records
+        :return: list of database records (empty if no scenes were found)
         """
-        west_lon_idx = 0
-        east_lon_idx = 1
-        south_lat_idx = 2
-        north_lat_idx = 3
-
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-        logger.debug("Perform query to find scene.")
-        if valid:
-            if n_recs > 0:
-                query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                                 EDDSentinel1ASF.Acquisition_Date >= end_date,
-                                                                 EDDSentinel1ASF.Invalid == False,
-                                                                 EDDSentinel1ASF.ARDProduct == True).filter(
-                                                                 (bbox[east_lon_idx] > EDDSentinel1ASF.West_Lon),
-                                                                 (EDDSentinel1ASF.East_Lon > bbox[west_lon_idx]),
-                                                                 (bbox[north_lat_idx] > EDDSentinel1ASF.South_Lat),
-                                                                 (EDDSentinel1ASF.North_Lat > bbox[south_lat_idx])).order_by(
-                    EDDSentinel1ASF.Acquisition_Date.desc())[start_rec:(start_rec + n_recs)]
-            else:
-                query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                                 EDDSentinel1ASF.Acquisition_Date >= end_date,
-                                                                 EDDSentinel1ASF.Invalid == False,
-                                                                 EDDSentinel1ASF.ARDProduct == True).filter(
-                                                                 (bbox[east_lon_idx] > EDDSentinel1ASF.West_Lon),
-                                                                 (EDDSentinel1ASF.East_Lon > bbox[west_lon_idx]),
-                                                                 (bbox[north_lat_idx] > EDDSentinel1ASF.South_Lat),
-                                                                 (EDDSentinel1ASF.North_Lat > bbox[south_lat_idx])).order_by(
-                    EDDSentinel1ASF.Acquisition_Date.desc()).all()
-        else:
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            scn_query = ses.query(EDDSentinel1ASF).options(sqlalchemy.orm.raiseload('*')).filter(
+                *self._date_filters(start_date, end_date, valid)).filter(*self._bbox_filters(bbox)).order_by(
+                EDDSentinel1ASF.Acquisition_Date.desc())
             if n_recs > 0:
-                query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                                 EDDSentinel1ASF.Acquisition_Date >= end_date).filter(
-                                                                 (bbox[east_lon_idx] > EDDSentinel1ASF.West_Lon),
-                                                                 (EDDSentinel1ASF.East_Lon > bbox[west_lon_idx]),
-                                                                 (bbox[north_lat_idx] > EDDSentinel1ASF.South_Lat),
-                                                                 (EDDSentinel1ASF.North_Lat > bbox[south_lat_idx])).order_by(
-                    EDDSentinel1ASF.Acquisition_Date.desc())[start_rec:(start_rec + n_recs)]
+                query_result = scn_query.limit(n_recs).offset(start_rec).all()
             else:
-                query_result = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Acquisition_Date <= start_date,
-                                                                 EDDSentinel1ASF.Acquisition_Date >= end_date).filter(
-                                                                 (bbox[east_lon_idx] > EDDSentinel1ASF.West_Lon),
-                                                                 (EDDSentinel1ASF.East_Lon > bbox[west_lon_idx]),
-                                                                 (bbox[north_lat_idx] > EDDSentinel1ASF.South_Lat),
-                                                                 (EDDSentinel1ASF.North_Lat > bbox[south_lat_idx])).order_by(
-                    EDDSentinel1ASF.Acquisition_Date.desc()).all()
-        ses.close()
-        scn_records = list()
-        if (query_result is not None) and (len(query_result) > 0):
-            for rec in query_result:
-                scn_records.append(rec)
-        else:
-            logger.error("No scenes were found within this date range.")
-            raise EODataDownException("No scenes were found within this date range.")
-        return scn_records
+                query_result = scn_query.all()
+        if not query_result:
+            logger.debug("No scenes were found within this date range.")
+        return query_result
 
     def find_unique_scn_dates(self, start_date, end_date, valid=True, order_desc=True, platform=None):
         """
@@ -1847,123 +2087,76 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param platform: If None then all scenes, if value provided then it just be for that platform.
         :return: List of datetime.date objects.
         """
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-
-        if platform is None:
-            if valid:
-                if order_desc:
-                    scn_dates = ses.query(sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).filter(
-                        EDDSentinel1ASF.Acquisition_Date <= start_date,
-                        EDDSentinel1ASF.Acquisition_Date >= end_date,
-                        EDDSentinel1ASF.Invalid == False).group_by(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).order_by(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date).desc())
-                else:
-                    scn_dates = ses.query(sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).filter(
-                            EDDSentinel1ASF.Acquisition_Date <= start_date,
-                            EDDSentinel1ASF.Acquisition_Date >= end_date,
-                            EDDSentinel1ASF.Invalid == False).group_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).order_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date).asc())
-            else:
-                if order_desc:
-                    scn_dates = ses.query(sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).filter(
-                        EDDSentinel1ASF.Acquisition_Date <= start_date,
-                        EDDSentinel1ASF.Acquisition_Date >= end_date).group_by(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).order_by(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date).desc())
-                else:
-                    scn_dates = ses.query(sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).filter(
-                            EDDSentinel1ASF.Acquisition_Date <= start_date,
-                            EDDSentinel1ASF.Acquisition_Date >= end_date).group_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).order_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date).asc())
+        cache_key = (start_date, end_date, valid, order_desc, platform)
+        if cache_key in self._scn_dates_cache:
+            cache_time, scn_dates = self._scn_dates_cache[cache_key]
+            if (time.monotonic() - cache_time) < self._query_cache_ttl:
+                return list(scn_dates)
+
+        filters = self._date_filters(start_date, end_date, valid=False)
+        if valid:
+            filters.append(EDDSentinel1ASF.Invalid == False)
+        if platform is not None:
+            filters.append(EDDSentinel1ASF.Platform == platform)
+
+        scn_date_col = sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)
+        if order_desc:
+            order_by = scn_date_col.desc()
         else:
-            if valid:
-                if order_desc:
-                    scn_dates = ses.query(sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).filter(
-                            EDDSentinel1ASF.Acquisition_Date <= start_date,
-                            EDDSentinel1ASF.Acquisition_Date >= end_date,
-                            EDDSentinel1ASF.Invalid == False,
-                            EDDSentinel1ASF.Platform == platform).group_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).order_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date).desc())
-                else:
-                    scn_dates = ses.query(sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).filter(
-                            EDDSentinel1ASF.Acquisition_Date <= start_date,
-                            EDDSentinel1ASF.Acquisition_Date >= end_date,
-                            EDDSentinel1ASF.Invalid == False,
-                            EDDSentinel1ASF.Platform == platform).group_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).order_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date).asc())
-            else:
-                if order_desc:
-                    scn_dates = ses.query(sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).filter(
-                            EDDSentinel1ASF.Acquisition_Date <= start_date,
-                            EDDSentinel1ASF.Acquisition_Date >= end_date,
-                            EDDSentinel1ASF.Platform == platform).group_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).order_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date).desc())
-                else:
-                    scn_dates = ses.query(sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).filter(
-                            EDDSentinel1ASF.Acquisition_Date <= start_date,
-                            EDDSentinel1ASF.Acquisition_Date >= end_date,
-                            EDDSentinel1ASF.Platform == platform).group_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date)).order_by(
-                            sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date).asc())
-        ses.close()
-        return scn_dates
+            order_by = scn_date_col.asc()
+
+        with self._session() as ses:
+            scn_dates = ses.query(scn_date_col).filter(*filters).distinct().order_by(order_by).all()
+        cache_time = time.monotonic()
+        # Remove the expired entries and, if still full, the oldest entries (the dict is in insertion order).
+        self._scn_dates_cache = {c_key: c_val for c_key, c_val in self._scn_dates_cache.items()
+                                 if ((cache_time - c_val[0]) < self._query_cache_ttl) and (c_key != cache_key)}
+        while len(self._scn_dates_cache) >= self._scn_dates_cache_max:
+            del self._scn_dates_cache[next(iter(self._scn_dates_cache))]
+        self._scn_dates_cache[cache_key] = (cache_time, scn_dates)
+        return list(scn_dates)
+
+    def _scns_for_date_filters(self, date_of_interest, valid, ard_prod, platform):
+        """
+        A function which creates the filters used to select the scenes acquired on a particular date.
+
+        :param date_of_interest: a datetime.date object specifying the date of interest (if a datetime.datetime
+                                 is provided then its date is used).
+        :param valid: If True only valid observations are considered.
+        :param ard_prod: If True only observations which have been converted to an ARD product are considered.
+        :param platform: If None then all scenes, if value provided then it just be for that platform.
+        :return: list of sqlalchemy filter expressions.
+        """
+        if isinstance(date_of_interest, datetime.datetime):
+            date_of_interest = date_of_interest.date()
+        # Use a range on Acquisition_Date (rather than casting it to a date) so an index can be used.
+        day_start = datetime.datetime.combine(date_of_interest, datetime.time.min)
+        day_end = day_start + datetime.timedelta(days=1)
+
+        filters = [EDDSentinel1ASF.Acquisition_Date >= day_start,
+                   EDDSentinel1ASF.Acquisition_Date < day_end]
+        if valid:
+            filters.append(EDDSentinel1ASF.Invalid == False)
+        if ard_prod:
+            filters.append(EDDSentinel1ASF.ARDProduct == True)
+        if platform is not None:
+            filters.append(EDDSentinel1ASF.Platform == platform)
+        return filters
 
     def get_scns_for_date(self, date_of_interest, valid=True, ard_prod=True, platform=None):
         """
         A function to retrieve a list of scenes which have been acquired on a particular date.
 
-        :param date_of_interest: a datetime.date object specifying the date of interest.
+        :param date_of_interest: a datetime.date object specifying the date of interest (if a datetime.datetime
+                                 is provided then its date is used).
         :param valid: If True only valid observations are considered.
         :param ard_prod: If True only observations which have been converted to an ARD product are considered.
         :param platform: If None then all scenes, if value provided then it just be for that platform.
         :return: a list of sensor objects
         """
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-
-        if platform is None:
-            if valid and ard_prod:
-                scns = ses.query(EDDSentinel1ASF).filter(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date) == date_of_interest,
-                        EDDSentinel1ASF.Invalid == False, EDDSentinel1ASF.ARDProduct == True).all()
-            elif valid:
-                scns = ses.query(EDDSentinel1ASF).filter(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date) == date_of_interest,
-                        EDDSentinel1ASF.Invalid == False).all()
-            elif ard_prod:
-                scns = ses.query(EDDSentinel1ASF).filter(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date) == date_of_interest,
-                        EDDSentinel1ASF.ARDProduct == True).all()
-            else:
-                scns = ses.query(EDDSentinel1ASF).filter(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date) == date_of_interest).all()
-        else:
-            if valid and ard_prod:
-                scns = ses.query(EDDSentinel1ASF).filter(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date) == date_of_interest,
-                        EDDSentinel1ASF.Invalid == False, EDDSentinel1ASF.ARDProduct == True,
-                        EDDSentinel1ASF.Platform == platform).all()
-            elif valid:
-                scns = ses.query(EDDSentinel1ASF).filter(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date) == date_of_interest,
-                        EDDSentinel1ASF.Invalid == False, EDDSentinel1ASF.Platform == platform).all()
-            elif ard_prod:
-                scns = ses.query(EDDSentinel1ASF).filter(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date) == date_of_interest,
-                        EDDSentinel1ASF.ARDProduct == True, EDDSentinel1ASF.Platform == platform).all()
-            else:
-                scns = ses.query(EDDSentinel1ASF).filter(
-                        sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date) == date_of_interest,
-                        EDDSentinel1ASF.Platform == platform).all()
+        with self._session() as ses:
+            scns = ses.query(EDDSentinel1ASF).options(sqlalchemy.orm.raiseload('*')).filter(
+                *self._scns_for_date_filters(date_of_interest, valid, ard_prod, platform)).all()
         return scns
 
     def get_scn_pids_for_date(self, date_of_interest, valid=True, ard_prod=True, platform=None):
@@ -1976,16 +2169,40 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param platform: If None then all scenes, if value provided then it just be for that platform.
         :return: a list of PIDs (ints)
         """
-        scns = self.get_scns_for_date(date_of_interest, valid, ard_prod, platform)
-        scn_pids = list()
-        for scn in scns:
-            scn_pids.append(scn.PID)
-        return scn_pids
+        with self._session() as ses:
+            query_result = ses.query(EDDSentinel1ASF.PID).filter(
+                *self._scns_for_date_filters(date_of_interest, valid, ard_prod, platform)).all()
+        return [scn[0] for scn in query_result]
 
-    def create_scn_date_imgs(self, start_date, end_date, img_size, out_img_dir, img_format, vec_file, vec_lyr, tmp_dir, order_desc=True):
+    def _find_ard_img_file(self, ard_path):
+        """
+        A function which finds the ARD (dB) image within an ARD product directory. The result is
+        cached and reused while the modification time of the directory is unchanged.
+
+        :param ard_path: the ARD product directory for the scene.
+        :return: file path for the ARD image.
+        """
+        try:
+            dir_mtime = os.stat(ard_path).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is not None:
+            cached = self._ard_file_cache.get(ard_path)
+            if (cached is not None) and (cached[0] == dir_mtime):
+                return cached[1]
+        eoddutils = eodatadown.eodatadownutils.EODataDownUtils()
+        ard_file = eoddutils.findFile(ard_path, "*dB*.tif")
+        if dir_mtime is not None:
+            self._ard_file_cache[ard_path] = (dir_mtime, ard_file)
+        return ard_file
+
+    def create_scn_date_imgs(self, start_date, end_date, img_size, out_img_dir, img_format, vec_file, vec_lyr,
+                             tmp_dir, order_desc=True, n_cores=1):
         """
         A function which created stretched and formatted visualisation images by combining all the scenes
         for a particular date. It does that for each of the unique dates within the date range specified.
+        All the valid ARD scenes acquired on each date are used, including the scenes on the first and
+        last dates which are outside the start and end times.
 
         :param start_date: A python datetime object specifying the start date (most recent date)
         :param end_date: A python datetime object specifying the end date (earliest date)
@@ -1995,6 +2212,8 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param vec_file: A vector file (polyline) which can be overlaid for context.
         :param vec_lyr: The layer in the vector file.
         :param tmp_dir: A temp directory for intermediate files.
+        :param order_desc: If True then the dates are processed in descending order otherwise ascending.
+        :param n_cores: The number of dates for which images are created in parallel.
         :return: dict with date (YYYYMMDD) as key with a dict of image info, including
                  an qkimage field for the generated image
         """
@@ -2007,35 +2226,60 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
             out_img_ext = 'tif'
         else:
             raise EODataDownException("The input image format ({}) was recognised".format(img_format))
-        eoddutils = eodatadown.eodatadownutils.EODataDownUtils()
-        scn_dates = self.find_unique_scn_dates(start_date, end_date, valid=True, order_desc=order_desc)
+
+        # Retrieve all the scenes within the date range in a single query and group them by date.
+        # All the scenes acquired on each date are combined, so the whole of the first and last
+        # days are included even if some of their scenes are outside the start/end times.
+        start_day = start_date.date() if isinstance(start_date, datetime.datetime) else start_date
+        end_day = end_date.date() if isinstance(end_date, datetime.datetime) else end_date
+        if start_day < end_day:
+            start_day, end_day = end_day, start_day
+        with self._session() as ses:
+            if order_desc:
+                order_by = EDDSentinel1ASF.Acquisition_Date.desc()
+            else:
+                order_by = EDDSentinel1ASF.Acquisition_Date.asc()
+            scns = ses.query(EDDSentinel1ASF).options(sqlalchemy.orm.raiseload('*')).filter(
+                sqlalchemy.cast(EDDSentinel1ASF.Acquisition_Date, sqlalchemy.Date).between(end_day, start_day),
+                EDDSentinel1ASF.Invalid == False, EDDSentinel1ASF.ARDProduct == True).order_by(order_by).all()
+        date_scns = dict()
+        for scn in scns:
+            scn_date = scn.Acquisition_Date.date()
+            if scn_date not in date_scns:
+                date_scns[scn_date] = list()
+            date_scns[scn_date].append(scn)
+
+        # VV, VH, VV/VH
+        bands = '1,2,3'
+
         scn_qklks = dict()
-        for scn_date in scn_dates:
-            print("Processing {}:".format(scn_date[0].strftime('%Y-%m-%d')))
-            scns = self.get_scns_for_date(scn_date[0])
+        qklk_params = list()
+        for scn_date in date_scns:
+            print("Processing {}:".format(scn_date.strftime('%Y-%m-%d')))
             scn_files = []
-            for scn in scns:
-                ard_file = eoddutils.findFile(scn.ARDProduct_Path, "*dB*.tif")
+            for scn in date_scns[scn_date]:
+                ard_file = self._find_ard_img_file(scn.ARDProduct_Path)
                 print("\t{}: {} - {}".format(scn.PID, scn.Scene_ID, ard_file))
                 scn_files.append(ard_file)
 
-            # VV, VH, VV/VH
-            bands = '1,2,3'
-
-            scn_date_str = scn_date[0].strftime('%Y%m%d')
+            scn_date_str = scn_date.strftime('%Y%m%d')
             quicklook_img = os.path.join(out_img_dir, "sen1_qklk_{}.{}".format(scn_date_str, out_img_ext))
-            import rsgislib.tools.visualisation
-            rsgislib.tools.visualisation.createQuicklookOverviewImgsVecOverlay(scn_files, bands, tmp_dir,
-                                                                               vec_file, vec_lyr,
-                                                                               outputImgs=quicklook_img,
-                                                                               output_img_sizes=img_size,
-                                                                               gdalformat=img_format,
-                                                                               scale_axis='auto',
-                                                                               stretch_file=self.std_vis_img_stch,
-                                                                               overlay_clr=[255, 255, 255])
+            # Each date has its own temp directory so dates can be processed in parallel.
+            date_tmp_dir = os.path.join(tmp_dir, "sen1_qklk_{}".format(scn_date_str))
+            qklk_params.append([scn_files, bands, date_tmp_dir, vec_file, vec_lyr, quicklook_img, img_size,
+                                img_format, self.std_vis_img_stch])
             scn_qklks[scn_date_str] = dict()
             scn_qklks[scn_date_str]['qkimage'] = quicklook_img
-            scn_qklks[scn_date_str]['scn_date'] = scn_date[0]
+            scn_qklks[scn_date_str]['scn_date'] = scn_date
+
+        if (len(qklk_params) > 0) and (rsgis_vis is None):
+            raise EODataDownException("The rsgislib.tools.visualisation module could not be imported.")
+        if n_cores > 1:
+            with multiprocessing.Pool(processes=n_cores) as pool:
+                pool.map(_create_scn_date_qklk, qklk_params)
+        else:
+            for params in qklk_params:
+                _create_scn_date_qklk(params)
         return scn_qklks
 
     def create_multi_scn_visual(self, scn_pids, out_imgs, out_img_sizes, out_extent_vec, out_extent_lyr,
@@ -2052,13 +2296,29 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
 
         """
         eoddutils = eodatadown.eodatadownutils.EODataDownUtils()
-        # Get the ARD images.
-        ard_images = []
+        # Get the ARD product paths, in batches of PIDs to keep the IN lists to a sensible size.
+        # Any iterable of PIDs (e.g., a set or generator) can be provided so make a list to slice.
+        scn_pids = list(scn_pids)
+        scn_ard_paths = dict()
+        with self._session() as ses:
+            for i in range(0, len(scn_pids), 1000):
+                pids_batch = scn_pids[i:(i + 1000)]
+                query_result = ses.query(EDDSentinel1ASF.PID, EDDSentinel1ASF.ARDProduct_Path).filter(
+                    EDDSentinel1ASF.PID.in_(pids_batch)).all()
+                for scn_pid, ard_path in query_result:
+                    scn_ard_paths[scn_pid] = ard_path
+
+        ard_paths = []
         for pid in scn_pids:
-            scn = self.get_scn_record(pid)
-            ard_file = eoddutils.findFileNone(scn.ARDProduct_Path, "*dB*.tif")
-            if ard_file is not None:
-                ard_images.append(ard_file)
+            if pid not in scn_ard_paths:
+                logger.error("PID {0} has not returned a scene - check inputs.".format(pid))
+                raise EODataDownException("PID {0} has not returned a scene - check inputs.".format(pid))
+            ard_paths.append(scn_ard_paths[pid])
+
+        # Get the ARD images; the file system look ups are I/O bound so are run concurrently.
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            ard_files = executor.map(lambda ard_path: eoddutils.findFileNone(ard_path, "*dB*.tif"), ard_paths)
+            ard_images = [ard_file for ard_file in ard_files if ard_file is not None]
 
         if len(ard_images) > 0:
             # VV, VH, VV/VH
@@ -2072,11 +2332,12 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
                 strch_file_path = os.path.split(out_imgs[0])[0]
                 strch_file = os.path.join(strch_file_path, "{}_srtch_stats.txt".format(strch_file_basename))
 
-            import rsgislib.tools.visualisation
-            rsgislib.tools.visualisation.createVisualOverviewImgsVecExtent(ard_images, bands, tmp_dir,
-                                                                           out_extent_vec, out_extent_lyr,
-                                                                           out_imgs, out_img_sizes, gdal_format,
-                                                                           'auto', strch_file, export_stretch_file)
+            if rsgis_vis is None:
+                raise EODataDownException("The rsgislib.tools.visualisation module could not be imported.")
+            rsgis_vis.createVisualOverviewImgsVecExtent(ard_images, bands, tmp_dir,
+                                                        out_extent_vec, out_extent_lyr,
+                                                        out_imgs, out_img_sizes, gdal_format,
+                                                        'auto', strch_file, export_stretch_file)
             return True
         # else there weren't any ard_images...
         return False
@@ -2131,92 +2392,138 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         This function exports the database table to a JSON file.
         :param out_json_file: output JSON file path.
         """
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-
-        eodd_utils = eodatadown.eodatadownutils.EODataDownUtils()
-
-        query_result = ses.query(EDDSentinel1ASF).all()
-        db_scn_dict = dict()
-        for scn in query_result:
-            db_scn_dict[scn.PID] = dict()
-            db_scn_dict[scn.PID]['PID'] = scn.PID
-            db_scn_dict[scn.PID]['Scene_ID'] = scn.Scene_ID
-            db_scn_dict[scn.PID]['Product_Name'] = scn.Product_Name
-            db_scn_dict[scn.PID]['Product_File_ID'] = scn.Product_File_ID
-            db_scn_dict[scn.PID]['ABS_Orbit'] = scn.ABS_Orbit
-            db_scn_dict[scn.PID]['Rel_Orbit'] = scn.Rel_Orbit
-            db_scn_dict[scn.PID]['Doppler'] = scn.Doppler
-            db_scn_dict[scn.PID]['Flight_Direction'] = scn.Flight_Direction
-            db_scn_dict[scn.PID]['Granule_Name'] = scn.Granule_Name
-            db_scn_dict[scn.PID]['Granule_Type'] = scn.Granule_Type
-            db_scn_dict[scn.PID]['Incidence_Angle'] = scn.Incidence_Angle
-            db_scn_dict[scn.PID]['Look_Direction'] = scn.Look_Direction
-            db_scn_dict[scn.PID]['Platform'] = scn.Platform
-            db_scn_dict[scn.PID]['Polarization'] = scn.Polarization
-            db_scn_dict[scn.PID]['Process_Date'] = eodd_utils.getDateTimeAsString(scn.Process_Date)
-            db_scn_dict[scn.PID]['Process_Description'] = scn.Process_Description
-            db_scn_dict[scn.PID]['Process_Level'] = scn.Process_Level
-            db_scn_dict[scn.PID]['Process_Type'] = scn.Process_Type
-            db_scn_dict[scn.PID]['Process_Type_Disp'] = scn.Process_Type_Disp
-            db_scn_dict[scn.PID]['Acquisition_Date'] = eodd_utils.getDateTimeAsString(scn.Acquisition_Date)
-            db_scn_dict[scn.PID]['Sensor'] = scn.Sensor
-            db_scn_dict[scn.PID]['BeginPosition'] = eodd_utils.getDateTimeAsString(scn.BeginPosition)
-            db_scn_dict[scn.PID]['EndPosition'] = eodd_utils.getDateTimeAsString(scn.EndPosition)
-            db_scn_dict[scn.PID]['North_Lat'] = scn.North_Lat
-            db_scn_dict[scn.PID]['South_Lat'] = scn.South_Lat
-            db_scn_dict[scn.PID]['East_Lon'] = scn.East_Lon
-            db_scn_dict[scn.PID]['West_Lon'] = scn.West_Lon
-            db_scn_dict[scn.PID]['Remote_URL'] = scn.Remote_URL
-            db_scn_dict[scn.PID]['Remote_FileName'] = scn.Remote_FileName
-            db_scn_dict[scn.PID]['Remote_URL_MD5'] = scn.Remote_URL_MD5
-            db_scn_dict[scn.PID]['Total_Size'] = scn.Total_Size
-            db_scn_dict[scn.PID]['Query_Date'] = eodd_utils.getDateTimeAsString(scn.Query_Date)
-            db_scn_dict[scn.PID]['Download_Start_Date'] = eodd_utils.getDateTimeAsString(scn.Download_Start_Date)
-            db_scn_dict[scn.PID]['Download_End_Date'] = eodd_utils.getDateTimeAsString(scn.Download_End_Date)
-            db_scn_dict[scn.PID]['Downloaded'] = scn.Downloaded
-            db_scn_dict[scn.PID]['Download_Path'] = scn.Download_Path
-            db_scn_dict[scn.PID]['Archived'] = scn.Archived
-            db_scn_dict[scn.PID]['ARDProduct_Start_Date'] = eodd_utils.getDateTimeAsString(scn.ARDProduct_Start_Date)
-            db_scn_dict[scn.PID]['ARDProduct_End_Date'] = eodd_utils.getDateTimeAsString(scn.ARDProduct_End_Date)
-            db_scn_dict[scn.PID]['ARDProduct'] = scn.ARDProduct
-            db_scn_dict[scn.PID]['ARDProduct_Path'] = scn.ARDProduct_Path
-            db_scn_dict[scn.PID]['DCLoaded_Start_Date'] = eodd_utils.getDateTimeAsString(scn.DCLoaded_Start_Date)
-            db_scn_dict[scn.PID]['DCLoaded_End_Date'] = eodd_utils.getDateTimeAsString(scn.DCLoaded_End_Date)
-            db_scn_dict[scn.PID]['DCLoaded'] = scn.DCLoaded
-            db_scn_dict[scn.PID]['Invalid'] = scn.Invalid
-            db_scn_dict[scn.PID]['ExtendedInfo'] = scn.ExtendedInfo
-            db_scn_dict[scn.PID]['RegCheck'] = scn.RegCheck
-        ses.close()
+        # orjson (if available) is only used to encode the records, which are formatted as for the json module.
+        def _json_encode(obj):
+            return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+        if orjson is not None:
+            def _encode(obj):
+                # orjson writes non-finite floats as null so json is used for those records (written as NaN).
+                if isinstance(obj, dict) and any((isinstance(val, float) and not math.isfinite(val))
+                                                 for val in obj.values()):
+                    return _json_encode(obj)
+                return orjson.dumps(obj)
+        else:
+            _encode = _json_encode
 
-        db_plgin_dict = dict()
+        plugin_keys = list()
         if self.calc_scn_usr_analysis():
             plugin_keys = self.get_usr_analysis_keys()
-            for plgin_key in plugin_keys:
-                query_result = ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.PlugInName == plgin_key).all()
-                db_plgin_dict[plgin_key] = dict()
-                for scn in query_result:
-                    db_plgin_dict[plgin_key][scn.Scene_PID] = dict()
-                    db_plgin_dict[plgin_key][scn.Scene_PID]['Scene_PID'] = scn.Scene_PID
-                    db_plgin_dict[plgin_key][scn.Scene_PID]['PlugInName'] = scn.PlugInName
-                    db_plgin_dict[plgin_key][scn.Scene_PID]['Start_Date'] = eodd_utils.getDateTimeAsString(
-                            scn.Start_Date)
-                    db_plgin_dict[plgin_key][scn.Scene_PID]['End_Date'] = eodd_utils.getDateTimeAsString(scn.End_Date)
-                    db_plgin_dict[plgin_key][scn.Scene_PID]['Completed'] = scn.Completed
-                    db_plgin_dict[plgin_key][scn.Scene_PID]['Success'] = scn.Success
-                    db_plgin_dict[plgin_key][scn.Scene_PID]['Outputs'] = scn.Outputs
-                    db_plgin_dict[plgin_key][scn.Scene_PID]['Error'] = scn.Error
-                    db_plgin_dict[plgin_key][scn.Scene_PID]['ExtendedInfo'] = scn.ExtendedInfo
-        ses.close()
 
-        fnl_out_dict = dict()
-        fnl_out_dict['scn_db'] = db_scn_dict
-        if db_plgin_dict:
-            fnl_out_dict['plgin_db'] = db_plgin_dict
-
-        with open(out_json_file, 'w') as outfile:
-            json.dump(fnl_out_dict, outfile, indent=4, separators=(',', ': '), ensure_ascii=False)
+        # The records are written to the file as they are read from the database (one per line)
+        # rather than building the whole document in memory first.
+        with self._session() as ses, open(out_json_file, 'wb', buffering=1 << 20) as outfile:
+            # Read the rows through the core table (rather than ORM objects) as plain mappings.
+            scn_cols = _S1ASF_EXPORT_COLS
+            query_result = ses.execute(sqlalchemy.select(EDDSentinel1ASF.__table__).execution_options(
+                    stream_results=True)).mappings().yield_per(1000)
+            outfile.write(b'{"scn_db": {')
+            rec_sep = b'\n'
+            for scn in query_result:
+                # Values are in column order; the datetimes are formatted as EODataDownUtils.getDateTimeAsString.
+                scn_rec = {name: (('' if val is None else val.isoformat()) if is_dt else val)
+                           for (name, is_dt), val in zip(scn_cols, scn.values())}
+                outfile.write(rec_sep + _encode(str(scn['PID'])) + b': ' + _encode(scn_rec))
+                rec_sep = b',\n'
+            outfile.write(b'\n}')
+
+            if len(plugin_keys) > 0:
+                plgin_cols = _S1ASF_PLGIN_EXPORT_COLS
+                # Read the records for all the plugins with one query, ordered so each plugin is written in turn.
+                query_result = ses.execute(sqlalchemy.select(EDDSentinel1ASFPlugins.__table__).where(
+                        EDDSentinel1ASFPlugins.__table__.c.PlugInName.in_(plugin_keys)).order_by(
+                        EDDSentinel1ASFPlugins.__table__.c.PlugInName).execution_options(
+                        stream_results=True)).mappings().yield_per(1000)
+                outfile.write(b',\n"plgin_db": {')
+                plgin_sep = b'\n'
+                written_plgin_keys = set()
+                for scn in query_result:
+                    if scn['PlugInName'] not in written_plgin_keys:
+                        if len(written_plgin_keys) > 0:
+                            outfile.write(b'\n}')
+                        outfile.write(plgin_sep + _encode(scn['PlugInName']) + b': {')
+                        plgin_sep = b',\n'
+                        rec_sep = b'\n'
+                        written_plgin_keys.add(scn['PlugInName'])
+                    plgin_rec = {name: (('' if val is None else val.isoformat()) if is_dt else val)
+                                 for (name, is_dt), val in zip(plgin_cols, scn.values())}
+                    outfile.write(rec_sep + _encode(str(scn['Scene_PID'])) + b': ' + _encode(plgin_rec))
+                    rec_sep = b',\n'
+                if len(written_plgin_keys) > 0:
+                    outfile.write(b'\n}')
+                # Plugins without any records are written as empty objects.
+                for plgin_key in plugin_keys:
+                    if plgin_key not in written_plgin_keys:
+                        outfile.write(plgin_sep + _encode(plgin_key) + b': {}')
+                        plgin_sep = b',\n'
+                outfile.write(b'\n}')
+            outfile.write(b'}\n')
+
+    def _import_scn_record(self, scn_row, eodd_utils, replace_path_dict):
+        """
+        Convert a scene record read from an exported JSON file into a dict of column values.
+        :param scn_row: the scene record (dict) from the JSON file.
+        :param eodd_utils: an EODataDownUtils instance.
+        :param replace_path_dict: a dictionary of file paths to be updated, if None then ignored.
+        :return: dict of column values.
+        """
+        # Equivalent to EODataDownUtils.getDateTimeFromISOString (None for a blank value).
+        parse_dt = datetime.datetime.fromisoformat
+        scn_rec = {name: ((parse_dt(scn_row[name]) if scn_row[name] else None) if is_dt else scn_row[name])
+                   for name, is_dt in _S1ASF_EXPORT_COLS}
+        if replace_path_dict is not None:
+            scn_rec['Download_Path'] = eodd_utils.update_file_path(scn_rec['Download_Path'], replace_path_dict)
+            scn_rec['ARDProduct_Path'] = eodd_utils.update_file_path(scn_rec['ARDProduct_Path'], replace_path_dict)
+            scn_rec['ExtendedInfo'] = self.update_extended_info_qklook_tilecache_paths(scn_rec['ExtendedInfo'],
+                                                                                       replace_path_dict)
+        elif scn_rec['ExtendedInfo'] == "":
+            scn_rec['ExtendedInfo'] = None
+        return scn_rec
+
+    @staticmethod
+    def _import_plgin_record(plgin_row):
+        """
+        Convert a plugin record read from an exported JSON file into a dict of column values.
+        :param plgin_row: the plugin record (dict) from the JSON file.
+        :return: dict of column values.
+        """
+        parse_dt = datetime.datetime.fromisoformat
+        return {name: ((parse_dt(plgin_row[name]) if plgin_row[name] else None) if is_dt else plgin_row[name])
+                for name, is_dt in _S1ASF_PLGIN_EXPORT_COLS}
+
+    def _import_sensor_db_stream(self, json_file_obj, eodd_utils, replace_path_dict=None):
+        """
+        Import the database records from a JSON file (with the scn_db/plgin_db layout) parsing
+        the file incrementally using ijson so the whole file does not need to be held in memory.
+        The scene records are inserted in batches but only committed once all have been read.
+        :param json_file_obj: the input JSON file object (opened in binary mode).
+        :param eodd_utils: an EODataDownUtils instance.
+        :param replace_path_dict: a dictionary of file paths to be updated, if None then ignored.
+        :return: the number of scene records imported.
+        """
+        n_scn_recs = 0
+        with self._session() as ses:
+            db_records = list()
+            for pid, scn_row in ijson.kvitems(json_file_obj, 'scn_db', use_float=True):
+                db_records.append(self._import_scn_record(scn_row, eodd_utils, replace_path_dict))
+                if len(db_records) == _IMPORT_BATCH_SIZE:
+                    ses.bulk_insert_mappings(EDDSentinel1ASF, db_records)
+                    n_scn_recs += len(db_records)
+                    db_records = list()
+            if len(db_records) > 0:
+                ses.bulk_insert_mappings(EDDSentinel1ASF, db_records)
+                n_scn_recs += len(db_records)
+
+            if n_scn_recs > 0:
+                json_file_obj.seek(0)
+                # Each plugin table is read as a single item (one record per scene for the plugin).
+                for plgin_key, plgin_scns in ijson.kvitems(json_file_obj, 'plgin_db', use_float=True):
+                    db_plgin_records = [self._import_plgin_record(plgin_scns[scn_pid])
+                                        for scn_pid in plgin_scns]
+                    if len(db_plgin_records) > 0:
+                        ses.bulk_insert_mappings(EDDSentinel1ASFPlugins, db_plgin_records)
+                ses.commit()
+        return n_scn_recs
 
     def import_sensor_db(self, input_json_file, replace_path_dict=None):
         """
@@ -2229,85 +2536,43 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         db_records = list()
         db_plgin_records = list()
         eodd_utils = eodatadown.eodatadownutils.EODataDownUtils()
-        with open(input_json_file) as json_file_obj:
-            db_data = json.load(json_file_obj)
+        with open(input_json_file, 'rb') as json_file_obj:
+            if (ijson is not None) and (os.path.getsize(input_json_file) > _IMPORT_STREAM_MIN_SIZE):
+                # Files without the scn_db key (older layout) are read using json/orjson below.
+                first_key = next((value for prefix, event, value in ijson.parse(json_file_obj)
+                                  if event == 'map_key'), None)
+                json_file_obj.seek(0)
+                if first_key in ('scn_db', 'plgin_db'):
+                    logger.debug("Importing the database records from '{}' using ijson.".format(input_json_file))
+                    if self._import_sensor_db_stream(json_file_obj, eodd_utils, replace_path_dict) > 0:
+                        self._clear_query_caches()
+                    return
+
+            if orjson is not None:
+                db_data = orjson.loads(json_file_obj.read())
+            else:
+                db_data = json.load(json_file_obj)
             if 'scn_db' in db_data:
                 sensor_rows = db_data['scn_db']
             else:
                 sensor_rows = db_data
 
             for pid in sensor_rows:
-                db_records.append(EDDSentinel1ASF(PID=sensor_rows[pid]['PID'],
-                                                  Scene_ID=sensor_rows[pid]['Scene_ID'],
-                                                  Product_Name=sensor_rows[pid]['Product_Name'],
-                                                  Product_File_ID=sensor_rows[pid]['Product_File_ID'],
-                                                  ABS_Orbit=sensor_rows[pid]['ABS_Orbit'],
-                                                  Rel_Orbit=sensor_rows[pid]['Rel_Orbit'],
-                                                  Doppler=sensor_rows[pid]['Doppler'],
-                                                  Flight_Direction=sensor_rows[pid]['Flight_Direction'],
-                                                  Granule_Name=sensor_rows[pid]['Granule_Name'],
-                                                  Granule_Type=sensor_rows[pid]['Granule_Type'],
-                                                  Incidence_Angle=sensor_rows[pid]['Incidence_Angle'],
-                                                  Look_Direction=sensor_rows[pid]['Look_Direction'],
-                                                  Platform=sensor_rows[pid]['Platform'],
-                                                  Polarization=sensor_rows[pid]['Polarization'],
-                                                  Process_Date=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['Process_Date']),
-                                                  Process_Description=sensor_rows[pid]['Process_Description'],
-                                                  Process_Level=sensor_rows[pid]['Process_Level'],
-                                                  Process_Type=sensor_rows[pid]['Process_Type'],
-                                                  Process_Type_Disp=sensor_rows[pid]['Process_Type_Disp'],
-                                                  Acquisition_Date=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['Acquisition_Date']),
-                                                  Sensor=sensor_rows[pid]['Sensor'],
-                                                  BeginPosition=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['BeginPosition']),
-                                                  EndPosition=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['EndPosition']),
-                                                  North_Lat=sensor_rows[pid]['North_Lat'],
-                                                  South_Lat=sensor_rows[pid]['South_Lat'],
-                                                  East_Lon=sensor_rows[pid]['East_Lon'],
-                                                  West_Lon=sensor_rows[pid]['West_Lon'],
-                                                  Remote_URL=sensor_rows[pid]['Remote_URL'],
-                                                  Remote_FileName=sensor_rows[pid]['Remote_FileName'],
-                                                  Remote_URL_MD5=sensor_rows[pid]['Remote_URL_MD5'],
-                                                  Total_Size=sensor_rows[pid]['Total_Size'],
-                                                  Query_Date=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['Query_Date']),
-                                                  Download_Start_Date=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['Download_Start_Date']),
-                                                  Download_End_Date=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['Download_End_Date']),
-                                                  Downloaded=sensor_rows[pid]['Downloaded'],
-                                                  Download_Path=eodd_utils.update_file_path(sensor_rows[pid]['Download_Path'],replace_path_dict),
-                                                  Archived=sensor_rows[pid]['Archived'],
-                                                  ARDProduct_Start_Date=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['ARDProduct_Start_Date']),
-                                                  ARDProduct_End_Date=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['ARDProduct_End_Date']),
-                                                  ARDProduct=sensor_rows[pid]['ARDProduct'],
-                                                  ARDProduct_Path=eodd_utils.update_file_path(sensor_rows[pid]['ARDProduct_Path'],replace_path_dict),
-                                                  DCLoaded_Start_Date=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['DCLoaded_Start_Date']),
-                                                  DCLoaded_End_Date=eodd_utils.getDateTimeFromISOString(sensor_rows[pid]['DCLoaded_End_Date']),
-                                                  DCLoaded=sensor_rows[pid]['DCLoaded'],
-                                                  Invalid=sensor_rows[pid]['Invalid'],
-                                                  ExtendedInfo=self.update_extended_info_qklook_tilecache_paths(sensor_rows[pid]['ExtendedInfo'], replace_path_dict),
-                                                  RegCheck=sensor_rows[pid]['RegCheck']))
-
-                if 'plgin_db' in db_data:
-                    plgin_rows = db_data['plgin_db']
-                    for plgin_key in plgin_rows:
-                        for scn_pid in plgin_rows[plgin_key]:
-                            db_plgin_records.append(EDDSentinel1ASFPlugins(Scene_PID=plgin_rows[plgin_key][scn_pid]['Scene_PID'],
-                                                                           PlugInName=plgin_rows[plgin_key][scn_pid]['PlugInName'],
-                                                                           Start_Date=eodd_utils.getDateTimeFromISOString(plgin_rows[plgin_key][scn_pid]['Start_Date']),
-                                                                           End_Date=eodd_utils.getDateTimeFromISOString(plgin_rows[plgin_key][scn_pid]['End_Date']),
-                                                                           Completed=plgin_rows[plgin_key][scn_pid]['Completed'],
-                                                                           Success=plgin_rows[plgin_key][scn_pid]['Success'],
-                                                                           Outputs=plgin_rows[plgin_key][scn_pid]['Outputs'],
-                                                                           Error=plgin_rows[plgin_key][scn_pid]['Error'],
-                                                                           ExtendedInfo=plgin_rows[plgin_key][scn_pid]['ExtendedInfo']))
+                db_records.append(self._import_scn_record(sensor_rows[pid], eodd_utils, replace_path_dict))
+
+            if 'plgin_db' in db_data:
+                plgin_rows = db_data['plgin_db']
+                for plgin_key in plgin_rows:
+                    for scn_pid in plgin_rows[plgin_key]:
+                        db_plgin_records.append(self._import_plgin_record(plgin_rows[plgin_key][scn_pid]))
         if len(db_records) > 0:
-            db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-            session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-            ses = session_sqlalc()
-            ses.add_all(db_records)
-            ses.commit()
-            if len(db_plgin_records) > 0:
-                ses.add_all(db_plgin_records)
+            with self._session() as ses:
+                # Insert the plain dicts in bulk rather than adding ORM objects to the session.
+                ses.bulk_insert_mappings(EDDSentinel1ASF, db_records)
+                if len(db_plgin_records) > 0:
+                    ses.bulk_insert_mappings(EDDSentinel1ASFPlugins, db_plgin_records)
                 ses.commit()
-            ses.close()
+            self._clear_query_caches()
 
     def create_gdal_gis_lyr(self, file_path, lyr_name, driver_name='GPKG', add_lyr=False):
         """
@@ -2327,52 +2592,43 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :param unq_id: unique id for the scene to be reset.
         :param reset_download: if True the download is deleted and reset in the database.
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-
-        logger.debug("Perform query to find scene.")
-        scn_record = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one_or_none()
-
-        if scn_record is None:
-            ses.close()
-            logger.error("PID {0} has not returned a scene - check inputs.".format(unq_id))
-            raise EODataDownException("PID {0} has not returned a scene - check inputs.".format(unq_id))
-
-        if scn_record.DCLoaded:
-            # How to remove from datacube?
-            scn_record.DCLoaded_Start_Date = None
-            scn_record.DCLoaded_End_Date = None
-            scn_record.DCLoaded = False
-
-        if scn_record.ARDProduct:
-            ard_path = scn_record.ARDProduct_Path
-            if os.path.exists(ard_path):
-                shutil.rmtree(ard_path)
-            scn_record.ARDProduct_Start_Date = None
-            scn_record.ARDProduct_End_Date = None
-            scn_record.ARDProduct_Path = ""
-            scn_record.ARDProduct = False
-
-        if scn_record.Downloaded and reset_download:
-            dwn_path = scn_record.Download_Path
-            if os.path.exists(dwn_path):
-                shutil.rmtree(dwn_path)
-            scn_record.Download_Start_Date = None
-            scn_record.Download_End_Date = None
-            scn_record.Download_Path = ""
-            scn_record.Downloaded = False
-
-        if reset_invalid:
-            scn_record.Invalid = False
-
-        scn_record.ExtendedInfo = None
-        flag_modified(scn_record, "ExtendedInfo")
-        ses.add(scn_record)
-
-        ses.commit()
-        ses.close()
+        with self._session() as ses:
+            logger.debug("Perform query to find scene.")
+            scn_record = ses.query(EDDSentinel1ASF.DCLoaded, EDDSentinel1ASF.ARDProduct,
+                                   EDDSentinel1ASF.ARDProduct_Path, EDDSentinel1ASF.Downloaded,
+                                   EDDSentinel1ASF.Download_Path).filter(EDDSentinel1ASF.PID == unq_id).one_or_none()
+
+            if scn_record is None:
+                logger.error("PID {0} has not returned a scene - check inputs.".format(unq_id))
+                raise EODataDownException("PID {0} has not returned a scene - check inputs.".format(unq_id))
+
+            # The fields to be reset are collected and written with a single UPDATE.
+            reset_vals = dict(ExtendedInfo=None)
+            rm_paths = list()
+            if scn_record.DCLoaded:
+                # How to remove from datacube?
+                reset_vals.update(DCLoaded_Start_Date=None, DCLoaded_End_Date=None, DCLoaded=False)
+
+            if scn_record.ARDProduct:
+                rm_paths.append(scn_record.ARDProduct_Path)
+                reset_vals.update(ARDProduct_Start_Date=None, ARDProduct_End_Date=None,
+                                  ARDProduct_Path="", ARDProduct=False)
+
+            if scn_record.Downloaded and reset_download:
+                rm_paths.append(scn_record.Download_Path)
+                reset_vals.update(Download_Start_Date=None, Download_End_Date=None,
+                                  Download_Path="", Downloaded=False)
+
+            if reset_invalid:
+                reset_vals["Invalid"] = False
+
+            # The files of the directory trees are deleted together using a single pool of threads. The
+            # database is only updated once the deletion has succeeded so a failed deletion aborts the reset.
+            _fast_rmtree([rm_path for rm_path in rm_paths if os.path.exists(rm_path)])
+
+            ses.execute(sqlalchemy.update(EDDSentinel1ASF).where(EDDSentinel1ASF.PID == unq_id).values(**reset_vals))
+            ses.commit()
+        self._clear_query_caches()
 
     def reset_dc_load(self, unq_id):
         """
@@ -2380,27 +2636,19 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         (i.e., sets the flag to False).
         :param unq_id: unique id for the scene to be reset.
         """
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-
-        logger.debug("Perform query to find scene.")
-        scn_record = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.PID == unq_id).one_or_none()
-
-        if scn_record is None:
-            ses.close()
-            logger.error("PID {0} has not returned a scene - check inputs.".format(unq_id))
-            raise EODataDownException("PID {0} has not returned a scene - check inputs.".format(unq_id))
-
-        if scn_record.DCLoaded:
+        with self._session() as ses:
             # How to remove from datacube?
-            scn_record.DCLoaded_Start_Date = None
-            scn_record.DCLoaded_End_Date = None
-            scn_record.DCLoaded = False
+            logger.debug("Reset the datacube loaded fields for the scene.")
+            upd_result = ses.execute(sqlalchemy.update(EDDSentinel1ASF).where(
+                    EDDSentinel1ASF.PID == unq_id).where(EDDSentinel1ASF.DCLoaded == True).values(
+                    DCLoaded_Start_Date=None, DCLoaded_End_Date=None, DCLoaded=False))
 
-        ses.commit()
-        ses.close()
+            if (upd_result.rowcount == 0) and (ses.execute(sqlalchemy.select(EDDSentinel1ASF.PID).where(
+                    EDDSentinel1ASF.PID == unq_id)).scalar() is None):
+                logger.error("PID {0} has not returned a scene - check inputs.".format(unq_id))
+                raise EODataDownException("PID {0} has not returned a scene - check inputs.".format(unq_id))
+
+            ses.commit()
 
     def get_sensor_summary_info(self):
         """
@@ -2411,117 +2659,120 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
         :return: dict of information.
 
         """
-        import statistics
         info_dict = dict()
-        logger.debug("Creating Database Engine and Session.")
-        db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-        session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-        ses = session_sqlalc()
-
-        logger.debug("Find the scene count.")
-        vld_scn_count = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Invalid == False).count()
-        invld_scn_count = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Invalid == True).count()
-        dwn_scn_count = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Downloaded == True).count()
-        ard_scn_count = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.ARDProduct == True).count()
-        dcload_scn_count = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.DCLoaded == True).count()
-        arch_scn_count = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Archived == True).count()
-        info_dict['n_scenes'] = dict()
-        info_dict['n_scenes']['n_valid_scenes'] = vld_scn_count
-        info_dict['n_scenes']['n_invalid_scenes'] = invld_scn_count
-        info_dict['n_scenes']['n_downloaded_scenes'] = dwn_scn_count
-        info_dict['n_scenes']['n_ard_processed_scenes'] = ard_scn_count
-        info_dict['n_scenes']['n_dc_loaded_scenes'] = dcload_scn_count
-        info_dict['n_scenes']['n_archived_scenes'] = arch_scn_count
-        logger.debug("Calculated the scene count.")
-
-        logger.debug("Find the scene file sizes.")
-        file_sizes = ses.query(EDDSentinel1ASF.Total_Size).filter(EDDSentinel1ASF.Invalid == False).all()
-        if file_sizes is not None:
-            if len(file_sizes) > 0:
-                file_sizes_nums = list()
-                for file_size in file_sizes:
-                    if file_size[0] is not None:
-                        file_sizes_nums.append(file_size[0])
-                if len(file_sizes_nums) > 0:
-                    total_file_size = sum(file_sizes_nums)
-                    info_dict['file_size'] = dict()
-                    info_dict['file_size']['file_size_total'] = total_file_size
-                    if total_file_size > 0:
-                        info_dict['file_size']['file_size_mean'] = statistics.mean(file_sizes_nums)
-                        info_dict['file_size']['file_size_min'] = min(file_sizes_nums)
-                        info_dict['file_size']['file_size_max'] = max(file_sizes_nums)
-                        if len(file_sizes_nums) > 1:
-                            info_dict['file_size']['file_size_stdev'] = statistics.stdev(file_sizes_nums)
-                        info_dict['file_size']['file_size_median'] = statistics.median(file_sizes_nums)
-                        if (len(file_sizes_nums) > 1) and (eodatadown.py_sys_version_flt >= 3.8):
-                            info_dict['file_size']['file_size_quartiles'] = statistics.quantiles(file_sizes_nums)
-        logger.debug("Calculated the scene file sizes.")
-
-        logger.debug("Find download and processing time stats.")
-        download_times = []
-        ard_process_times = []
-        scns = ses.query(EDDSentinel1ASF).filter(EDDSentinel1ASF.Downloaded == True)
-        for scn in scns:
-            download_times.append((scn.Download_End_Date - scn.Download_Start_Date).total_seconds())
-            if scn.ARDProduct:
-                ard_process_times.append((scn.ARDProduct_End_Date - scn.ARDProduct_Start_Date).total_seconds())
-
-        if len(download_times) > 0:
-            info_dict['download_time'] = dict()
-            info_dict['download_time']['download_time_mean_secs'] = statistics.mean(download_times)
-            info_dict['download_time']['download_time_min_secs'] = min(download_times)
-            info_dict['download_time']['download_time_max_secs'] = max(download_times)
-            if len(download_times) > 1:
-                info_dict['download_time']['download_time_stdev_secs'] = statistics.stdev(download_times)
-            info_dict['download_time']['download_time_median_secs'] = statistics.median(download_times)
-            if (len(download_times) > 1) and (eodatadown.py_sys_version_flt >= 3.8):
-                info_dict['download_time']['download_time_quartiles_secs'] = statistics.quantiles(download_times)
-
-        if len(ard_process_times) > 0:
-            info_dict['ard_process_time'] = dict()
-            info_dict['ard_process_time']['ard_process_time_mean_secs'] = statistics.mean(ard_process_times)
-            info_dict['ard_process_time']['ard_process_time_min_secs'] = min(ard_process_times)
-            info_dict['ard_process_time']['ard_process_time_max_secs'] = max(ard_process_times)
-            if len(ard_process_times) > 1:
-                info_dict['ard_process_time']['ard_process_time_stdev_secs'] = statistics.stdev(ard_process_times)
-            info_dict['ard_process_time']['ard_process_time_median_secs'] = statistics.median(ard_process_times)
-            if (len(ard_process_times) > 1) and (eodatadown.py_sys_version_flt >= 3.8):
-                info_dict['ard_process_time']['ard_process_time_quartiles_secs'] = statistics.quantiles(
-                        ard_process_times)
-        logger.debug("Calculated the download and processing time stats.")
+        with self._session() as ses:
+            logger.debug("Find the scene count.")
+            # All the counts are calculated with a single query (sum of a 1/0 flag for each condition).
+            def _count_where(condition):
+                return func.coalesce(func.sum(sqlalchemy.case((condition, 1), else_=0)), 0)
+            scn_counts = ses.execute(sqlalchemy.select(
+                    _count_where(EDDSentinel1ASF.Invalid == False).label('n_valid'),
+                    _count_where(EDDSentinel1ASF.Invalid == True).label('n_invalid'),
+                    _count_where(EDDSentinel1ASF.Downloaded == True).label('n_downloaded'),
+                    _count_where(EDDSentinel1ASF.ARDProduct == True).label('n_ard'),
+                    _count_where(EDDSentinel1ASF.DCLoaded == True).label('n_dc_loaded'),
+                    _count_where(EDDSentinel1ASF.Archived == True).label('n_archived'))).one()
+            info_dict['n_scenes'] = dict()
+            info_dict['n_scenes']['n_valid_scenes'] = scn_counts.n_valid
+            info_dict['n_scenes']['n_invalid_scenes'] = scn_counts.n_invalid
+            info_dict['n_scenes']['n_downloaded_scenes'] = scn_counts.n_downloaded
+            info_dict['n_scenes']['n_ard_processed_scenes'] = scn_counts.n_ard
+            info_dict['n_scenes']['n_dc_loaded_scenes'] = scn_counts.n_dc_loaded
+            info_dict['n_scenes']['n_archived_scenes'] = scn_counts.n_archived
+            logger.debug("Calculated the scene count.")
+
+            logger.debug("Find the scene file sizes.")
+            # The file size statistics are calculated within the database rather than reading every size.
+            file_size_col = EDDSentinel1ASF.Total_Size
+            file_size_stats = ses.execute(sqlalchemy.select(
+                    func.count(file_size_col).label('n'),
+                    func.sum(file_size_col).label('total'),
+                    func.avg(file_size_col).label('mean'),
+                    func.min(file_size_col).label('min'),
+                    func.max(file_size_col).label('max'),
+                    func.stddev_samp(file_size_col).label('stdev')).where(EDDSentinel1ASF.Invalid == False)).one()
+            if file_size_stats.n > 0:
+                total_file_size = file_size_stats.total
+                info_dict['file_size'] = dict()
+                info_dict['file_size']['file_size_total'] = total_file_size
+                if total_file_size > 0:
+                    # The median and quartiles use the same (exclusive) method as the other statistics.
+                    file_size_median, file_size_quartiles = _query_median_quartiles(
+                            ses, file_size_col, file_size_stats.n, EDDSentinel1ASF.Invalid == False)
+                    info_dict['file_size']['file_size_mean'] = float(file_size_stats.mean)
+                    info_dict['file_size']['file_size_min'] = file_size_stats.min
+                    info_dict['file_size']['file_size_max'] = file_size_stats.max
+                    info_dict['file_size']['file_size_median'] = float(file_size_median)
+                    if file_size_stats.n > 1:
+                        info_dict['file_size']['file_size_stdev'] = float(file_size_stats.stdev)
+                        info_dict['file_size']['file_size_quartiles'] = file_size_quartiles
+            logger.debug("Calculated the scene file sizes.")
+
+            logger.debug("Find download and processing time stats.")
+            download_times = []
+            ard_process_times = []
+            # Only read the download/ARD durations (in seconds), which are calculated by the database.
+            dwn_secs = sqlalchemy.extract('epoch', EDDSentinel1ASF.Download_End_Date -
+                                          EDDSentinel1ASF.Download_Start_Date)
+            ard_secs = sqlalchemy.extract('epoch', EDDSentinel1ASF.ARDProduct_End_Date -
+                                          EDDSentinel1ASF.ARDProduct_Start_Date)
+            scns = ses.query(dwn_secs.label('dwn_secs'), EDDSentinel1ASF.ARDProduct,
+                             ard_secs.label('ard_secs')).filter(EDDSentinel1ASF.Downloaded == True).yield_per(2000)
+            for scn in scns:
+                download_times.append(float(scn.dwn_secs))
+                if scn.ARDProduct:
+                    ard_process_times.append(float(scn.ard_secs))
 
-        if self.calc_scn_usr_analysis():
-            plgin_lst = self.get_usr_analysis_keys()
-            info_dict['usr_plugins'] = dict()
-            for plgin_key in plgin_lst:
-                info_dict['usr_plugins'][plgin_key] = dict()
-                scns = ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.PlugInName == plgin_key).all()
-                n_err_scns = 0
-                n_complete_scns = 0
-                n_success_scns = 0
-                plugin_times = []
-                for scn in scns:
-                    if scn.Completed:
-                        plugin_times.append((scn.End_Date - scn.Start_Date).total_seconds())
-                        n_complete_scns += 1
-                    if scn.Success:
-                        n_success_scns += 1
-                    if scn.Error:
-                        n_err_scns += 1
-                info_dict['usr_plugins'][plgin_key]['n_success'] = n_success_scns
-                info_dict['usr_plugins'][plgin_key]['n_completed'] = n_complete_scns
-                info_dict['usr_plugins'][plgin_key]['n_error'] = n_err_scns
-                if len(plugin_times) > 0:
-                    info_dict['usr_plugins'][plgin_key]['processing'] = dict()
-                    info_dict['usr_plugins'][plgin_key]['processing']['time_mean_secs'] = statistics.mean(plugin_times)
-                    info_dict['usr_plugins'][plgin_key]['processing']['time_min_secs'] = min(plugin_times)
-                    info_dict['usr_plugins'][plgin_key]['processing']['time_max_secs'] = max(plugin_times)
-                    if len(plugin_times) > 1:
-                        info_dict['usr_plugins'][plgin_key]['processing']['time_stdev_secs'] = statistics.stdev(plugin_times)
-                    info_dict['usr_plugins'][plgin_key]['processing']['time_median_secs'] = statistics.median(plugin_times)
-                    if (len(plugin_times) > 1) and (eodatadown.py_sys_version_flt >= 3.8):
-                        info_dict['usr_plugins'][plgin_key]['processing']['time_quartiles_secs'] = statistics.quantiles(plugin_times)
-        ses.close()
+            if len(download_times) > 0:
+                info_dict['download_time'] = _calc_summary_stats(download_times, 'download_time_', '_secs')
+
+            if len(ard_process_times) > 0:
+                info_dict['ard_process_time'] = _calc_summary_stats(ard_process_times, 'ard_process_time_', '_secs')
+            logger.debug("Calculated the download and processing time stats.")
+
+            if self.calc_scn_usr_analysis():
+                plgin_lst = self.get_usr_analysis_keys()
+                info_dict['usr_plugins'] = dict()
+                for plgin_key in plgin_lst:
+                    info_dict['usr_plugins'][plgin_key] = dict()
+                    info_dict['usr_plugins'][plgin_key]['n_success'] = 0
+                    info_dict['usr_plugins'][plgin_key]['n_completed'] = 0
+                    info_dict['usr_plugins'][plgin_key]['n_error'] = 0
+
+                # The counts and processing time statistics for all the plugins are calculated with one
+                # grouped query. The durations are NULL (and so ignored) for those which have not completed.
+                plgin_secs = sqlalchemy.case((EDDSentinel1ASFPlugins.Completed == True, sqlalchemy.extract(
+                        'epoch', EDDSentinel1ASFPlugins.End_Date - EDDSentinel1ASFPlugins.Start_Date)))
+                plgin_stats = ses.execute(sqlalchemy.select(
+                        EDDSentinel1ASFPlugins.PlugInName,
+                        _count_where(EDDSentinel1ASFPlugins.Success == True).label('n_success'),
+                        _count_where(EDDSentinel1ASFPlugins.Completed == True).label('n_completed'),
+                        _count_where(EDDSentinel1ASFPlugins.Error == True).label('n_error'),
+                        func.avg(plgin_secs).label('mean'),
+                        func.min(plgin_secs).label('min'),
+                        func.max(plgin_secs).label('max'),
+                        func.stddev_samp(plgin_secs).label('stdev')).where(
+                        EDDSentinel1ASFPlugins.PlugInName.in_(plgin_lst)).group_by(
+                        EDDSentinel1ASFPlugins.PlugInName)).all()
+                for plgin_stat in plgin_stats:
+                    plgin_info = info_dict['usr_plugins'][plgin_stat.PlugInName]
+                    plgin_info['n_success'] = plgin_stat.n_success
+                    plgin_info['n_completed'] = plgin_stat.n_completed
+                    plgin_info['n_error'] = plgin_stat.n_error
+                    if plgin_stat.n_completed > 0:
+                        # The median and quartiles use the same (exclusive) method as get_sensor_plugin_info.
+                        plgin_median, plgin_quartiles = _query_median_quartiles(
+                                ses, plgin_secs, plgin_stat.n_completed,
+                                EDDSentinel1ASFPlugins.PlugInName == plgin_stat.PlugInName)
+                        plgin_info['processing'] = dict()
+                        plgin_info['processing']['time_mean_secs'] = float(plgin_stat.mean)
+                        plgin_info['processing']['time_min_secs'] = float(plgin_stat.min)
+                        plgin_info['processing']['time_max_secs'] = float(plgin_stat.max)
+                        if plgin_stat.n_completed > 1:
+                            plgin_info['processing']['time_stdev_secs'] = float(plgin_stat.stdev)
+                        plgin_info['processing']['time_median_secs'] = float(plgin_median)
+                        if plgin_quartiles is not None:
+                            plgin_info['processing']['time_quartiles_secs'] = plgin_quartiles
         return info_dict
 
     def get_sensor_plugin_info(self, plgin_key):
@@ -2538,41 +2789,28 @@ class EODataDownSentinel1ASFProcessorSensor (EODataDownSentinel1ProcessorSensor)
             if plgin_key not in plugin_keys:
                 raise EODataDownException("The specified plugin ('{}') does not exist.".format(plgin_key))
 
-            import statistics
-            logger.debug("Creating Database Engine and Session.")
-            db_engine = sqlalchemy.create_engine(self.db_info_obj.dbConn)
-            session_sqlalc = sqlalchemy.orm.sessionmaker(bind=db_engine)
-            ses = session_sqlalc()
-            scns = ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.PlugInName == plgin_key).all()
-            n_err_scns = 0
-            n_complete_scns = 0
-            n_success_scns = 0
-            plugin_times = []
-            errors_dict = dict()
-            for scn in scns:
-                if scn.Completed:
-                    plugin_times.append((scn.End_Date - scn.Start_Date).total_seconds())
-                    n_complete_scns += 1
-                if scn.Success:
-                    n_success_scns += 1
-                if scn.Error:
-                    n_err_scns += 1
-                    errors_dict[scn.Scene_PID] = scn.ExtendedInfo
-            ses.close()
+            with self._session() as ses:
+                scns = ses.query(EDDSentinel1ASFPlugins).filter(EDDSentinel1ASFPlugins.PlugInName == plgin_key).all()
+                n_err_scns = 0
+                n_complete_scns = 0
+                n_success_scns = 0
+                plugin_times = []
+                errors_dict = dict()
+                for scn in scns:
+                    if scn.Completed:
+                        plugin_times.append((scn.End_Date - scn.Start_Date).total_seconds())
+                        n_complete_scns += 1
+                    if scn.Success:
+                        n_success_scns += 1
+                    if scn.Error:
+                        n_err_scns += 1
+                        errors_dict[scn.Scene_PID] = scn.ExtendedInfo
             info_dict[plgin_key] = dict()
             info_dict[plgin_key]['n_success'] = n_success_scns
             info_dict[plgin_key]['n_completed'] = n_complete_scns
             info_dict[plgin_key]['n_error'] = n_err_scns
             if len(plugin_times) > 0:
-                info_dict[plgin_key]['processing'] = dict()
-                info_dict[plgin_key]['processing']['time_mean_secs'] = statistics.mean(plugin_times)
-                info_dict[plgin_key]['processing']['time_min_secs'] = min(plugin_times)
-                info_dict[plgin_key]['processing']['time_max_secs'] = max(plugin_times)
-                if len(plugin_times) > 1:
-                    info_dict[plgin_key]['processing']['time_stdev_secs'] = statistics.stdev(plugin_times)
-                info_dict[plgin_key]['processing']['time_median_secs'] = statistics.median(plugin_times)
-                if (len(plugin_times) > 1) and (eodatadown.py_sys_version_flt >= 3.8):
-                    info_dict[plgin_key]['processing']['time_quartiles_secs'] = statistics.quantiles(plugin_times)
+                info_dict[plgin_key]['processing'] = _calc_summary_stats(plugin_times, 'time_', '_secs')
             if n_err_scns > 0:
                 info_dict[plgin_key]['errors'] = errors_dict
         else:
@@ -32,6 +32,7 @@ EODataDown - Utilities used within the EODataDown System.
 
 import base64
 import hashlib
+import mmap
 import os.path
 import datetime
 import logging
@@ -649,11 +650,22 @@ class EDDCheckFileHash(object):
         """
         md5 = hashlib.md5()
         with open(input_file, "rb") as f:
-            while True:
-                block_data = f.read(block_size)
-                if not block_data:
-                    break
-                md5.update(block_data)
+            # Memory map the file so the whole file is passed to hashlib in one
+            # call rather than read and hashed block by block within Python.
+            try:
+                f_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                f_mmap = None
+            if f_mmap is not None:
+                with f_mmap:
+                    md5.update(f_mmap)
+            else:
+                # Empty files (and files which cannot be mapped) are read in blocks.
+                while True:
+                    block_data = f.read(block_size)
+                    if not block_data:
+                        break
+                    md5.update(block_data)
         return md5.hexdigest()
 
 